@@ -40,6 +40,10 @@ VALID_EXTENSIONS = SUPPORTED_EXTENSIONS
 SETTINGS_FILE = "user_settings.json"
 CRASH_LOG_FILE = "crash_log.log"
 UI_THUMB_SIZE = (40, 40)
+# On-disk cache of sidecar thumbnails, keyed by a hash of the file's head + size
+THUMB_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".conniesuploader", "thumbs")
+THUMB_CACHE_HASH_BYTES = 65536
+THUMB_CACHE_MAX_FILES = 5000  # Oldest entries are pruned past this (~100-200 MB at most)
 
 # Upload Configuration
 DEFAULT_THREAD_COUNT = 5
@@ -49,6 +53,8 @@ DEFAULT_UPLOAD_TIMEOUT = 120  # seconds
 
 # Thread Pool Configuration
 THUMBNAIL_WORKERS = 4
+THUMBNAIL_DECODE_WORKERS = min(8, os.cpu_count() or 4)  # Per-file decodes across all batches
+IO_WORKERS = 2  # Background network/metadata calls made from the UI
 GO_WORKER_POOL_SIZE = 8
 
 # Auto-Post Configuration
@@ -64,11 +70,14 @@ MAX_FILENAME_LENGTH = 255
 
 # UI Update Intervals
 UI_UPDATE_INTERVAL_MS = 10
-UI_QUEUE_BATCH_SIZE = 10
-PROGRESS_UPDATE_BATCH_SIZE = 50
-UI_CLEANUP_INTERVAL_MS = 30000  # 30 seconds - cleanup orphaned images
+UI_QUEUE_MAXSIZE = 500  # Thumbnail workers block when full; each UI tick drains the whole queue
+UI_BULK_ADD_SIZE = 64  # Files per "add_bulk" ui_queue item when previews are off
+PROGRESS_UPDATE_BATCH_SIZE = 256  # Messages drained per tick; progress updates are coalesced
 UI_DROP_TARGET_DELAY_MS = 100  # Delay before registering drop targets after widget creation
+UI_DROP_DEBOUNCE_MS = 50  # Back-to-back drop events within this window are processed together
 UI_GALLERY_REFRESH_DELAY_MS = 200  # Gallery manager refresh delay
+UI_STATUS_THROTTLE_MS = 33  # Minimum gap between forced redraws while scanning (~30fps)
+LOG_CACHE_MAX = 5000  # Log lines kept in memory while the log window is closed
 
 # Keyring Services
 KEYRING_SERVICE_API = "ImageUploader:imx_api_key"
@@ -90,8 +99,11 @@ if sys.stderr:
 logger.add(CRASH_LOG_FILE, rotation="1 MB", retention="10 days", level="DEBUG", backtrace=True, diagnose=True)
 
 
+_NAT_SORT_RE = re.compile(r"(\d+)")
+
+
 def natural_sort_key(s: str):
-    return [int(text) if text.isdigit() else text.lower() for text in re.split(r"(\d+)", s)]
+    return tuple(int(text) if text.isdigit() else text.lower() for text in _NAT_SORT_RE.split(s))
 
 
 def resource_path(relative_path):
@@ -52,7 +52,7 @@ class RenameWorker(threading.Thread):
 class UploadController:
     def __init__(self) -> None:
         self.progress_queue = queue.Queue(maxsize=1000)
-        self.ui_queue = queue.Queue(maxsize=500)
+        self.ui_queue = queue.Queue(maxsize=config.UI_QUEUE_MAXSIZE)
         self.result_queue = queue.Queue(maxsize=1000)
         self.cancel_event = threading.Event()
 
@@ -60,6 +60,7 @@ class UploadController:
         self.template_mgr = TemplateManager()
 
         self.results = []
+        self.result_map: Dict[str, Tuple[str, str]] = {}  # file path -> (viewer_url, thumb_url)
         self.clipboard_buffer = []
         self.current_output_files = []
         self.pix_galleries_to_finalize = []
@@ -100,6 +101,7 @@ class UploadController:
         self.settings = settings
         self.cancel_event.clear()
         self.results = []
+        self.result_map = {}
         self.current_output_files = []
         self.clipboard_buffer = []
         self.pix_galleries_to_finalize = []
@@ -120,10 +122,11 @@ class UploadController:
 
     def stop_upload(self) -> None:
         """Signal all upload threads to stop gracefully."""
-        self.cancel_event.set()
+        self.upload_manager.cancel()
 
     def handle_upload_result(self, fp: str, img: str, thumb: str) -> bool:
         self.results.append((fp, img, thumb))
+        self.result_map[fp] = (img, thumb)
         self.upload_count += 1
         return self.upload_count >= self.upload_total
 
@@ -148,14 +151,12 @@ class UploadController:
                 logger.warning(f"Could not copy to clipboard: {e}")
 
     def generate_group_output(self, group_title: str, group_files: List[str], gallery_id: Optional[str], batch_index: int) -> None:
-        # Map file paths to results
-        res_map = {r[0]: (r[1], r[2]) for r in self.results}
         group_results = []
         svc = self.settings.get("service", "")
 
         for fp in group_files:
-            if fp in res_map:
-                viewer_url, thumb_url = res_map[fp]
+            if fp in self.result_map:
+                viewer_url, thumb_url = self.result_map[fp]
                 direct_url = viewer_url
 
                 # Fix direct links for IMX
@@ -298,5 +299,13 @@ class UploadController:
             folder = os.path.dirname(os.path.abspath(self.current_output_files[0]))
             if platform.system() == "Windows":
                 os.startfile(folder)
+            elif platform.system() == "Darwin":
+                subprocess.Popen(["open", folder])
             else:
-                subprocess.run(["xdg-open", folder], check=False, shell=False)
+                # Fire-and-forget: don't block the Tk thread while the file manager starts
+                subprocess.Popen(
+                    ["xdg-open", folder],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
+                )
@@ -2,6 +2,7 @@ import customtkinter as ctk
 import tkinter as tk
 from tkinter import messagebox
 from loguru import logger
+from . import config
 from .widgets import CollapsibleGroupFrame
 
 
@@ -13,7 +14,9 @@ class DragDropMixin:
       - self.groups
       - self.file_widgets
       - self.drag_data
-      - self.context_menu
+      - self._context_menus (see _build_context_menus)
+      - self._pending_drops / self._drop_flush_id (drop debounce state)
+      - self._misc_group (cached "Miscellaneous" group, or None)
       - self.thumb_executor
       - self.var_show_previews
     """
@@ -59,8 +62,22 @@ class DragDropMixin:
         except AttributeError as e:
             logger.warning(f"   Could not find target group for drop: {e}")
 
-        logger.info(f"   Calling _process_files()...")
-        self._process_files(files, target_group)
+        # Debounce: bursts of drop events are coalesced into one _process_files call per target
+        self._pending_drops.append((target_group, files))
+        if self._drop_flush_id is not None:
+            self.after_cancel(self._drop_flush_id)
+        self._drop_flush_id = self.after(config.UI_DROP_DEBOUNCE_MS, self._flush_drops)
+
+    def _flush_drops(self):
+        """Process all drops accumulated during the debounce window."""
+        self._drop_flush_id = None
+        pending, self._pending_drops = self._pending_drops, []
+        batches = {}
+        for target_group, files in pending:
+            batches.setdefault(target_group, []).extend(files)
+        for target_group, files in batches.items():
+            logger.info(f"   Calling _process_files() for {len(files)} dropped item(s)...")
+            self._process_files(files, target_group)
 
     def _clear_highlights(self, event=None):
         if self.highlighted_row:
@@ -128,14 +145,14 @@ class DragDropMixin:
 
         if target_group:
             with self.lock:
-                current_group = self.file_widgets[fp]["group"]
+                current_group = self.file_widgets[fp].group
 
             if target_group == current_group:
                 if target_row_widget and target_row_widget != self.drag_data["widget_start"]:
                     target_fp = None
                     with self.lock:
                         for f, w in self.file_widgets.items():
-                            if w["row"] == target_row_widget:
+                            if w.row == target_row_widget:
                                 target_fp = f
                                 break
                     if target_fp:
@@ -143,7 +160,7 @@ class DragDropMixin:
                         idx = current_group.files.index(target_fp)
                         current_group.files.insert(idx, fp)
                         with self.lock:
-                            self.file_widgets[fp]["row"].pack(before=target_row_widget)
+                            self.file_widgets[fp].row.pack(before=target_row_widget)
             else:
                 self._move_file_to_group(fp, current_group, target_group, before_widget=target_row_widget)
 
@@ -168,7 +185,7 @@ class DragDropMixin:
             if not found_row:
                 with self.lock:
                     for data in self.file_widgets.values():
-                        if data["row"] == curr:
+                        if data.row == curr:
                             found_row = curr
                             break
             if found_group:
@@ -186,7 +203,7 @@ class DragDropMixin:
             target_fp = None
             with self.lock:
                 for f, w in self.file_widgets.items():
-                    if w["row"] == before_widget:
+                    if w.row == before_widget:
                         target_fp = f
                         break
             if target_fp and target_fp in new_group.files:
@@ -199,12 +216,14 @@ class DragDropMixin:
 
         with self.lock:
             w_data = self.file_widgets[fp]
-            old_row = w_data["row"]
+            old_row = w_data.row
+            if w_data.state in ("success", "failed"):
+                old_group.done_count -= 1  # The rebuilt row starts out pending
         old_row.destroy()
 
         self._create_row(fp, None, new_group)
         with self.lock:
-            new_row = self.file_widgets[fp]["row"]
+            new_row = self.file_widgets[fp].row
 
         if before_widget:
             try:
@@ -215,21 +234,28 @@ class DragDropMixin:
         if self.var_show_previews.get():
             self.thumb_executor.submit(self._thumb_worker, [fp], new_group, True)
 
+    def _build_context_menus(self):
+        """Build the right-click menus once; handlers act on self._context_target."""
+        self._context_target = None
+        group_menu = tk.Menu(self, tearoff=0)
+        group_menu.add_command(label="Delete Batch", command=lambda: self._delete_group(self._context_target))
+        file_menu = tk.Menu(self, tearoff=0)
+        file_menu.add_command(label="Delete Image", command=lambda: self._delete_file(self._context_target))
+        return {"group": group_menu, "file": file_menu}
+
     def _show_group_context(self, event, group):
-        self.context_menu.delete(0, "end")
-        self.context_menu.add_command(label="Delete Batch", command=lambda: self._delete_group(group))
-        self.context_menu.tk_popup(event.x_root, event.y_root)
+        self._context_target = group
+        self._context_menus["group"].tk_popup(event.x_root, event.y_root)
 
     def _show_row_context(self, event, filepath):
         self._clear_highlights()
         with self.lock:
-            row = self.file_widgets[filepath]["row"]
+            row = self.file_widgets[filepath].row
         self.highlighted_row = row
         row.configure(fg_color="#E0E0E0" if ctk.get_appearance_mode() == "Light" else "#404040")
 
-        self.context_menu.delete(0, "end")
-        self.context_menu.add_command(label="Delete Image", command=lambda: self._delete_file(filepath))
-        self.context_menu.tk_popup(event.x_root, event.y_root)
+        self._context_target = filepath
+        self._context_menus["file"].tk_popup(event.x_root, event.y_root)
 
     def _delete_group(self, group):
         if messagebox.askyesno("Confirm", f"Delete batch '{group.title}'?"):
@@ -237,12 +263,12 @@ class DragDropMixin:
                 with self.lock:
                     if fp in self.file_widgets:
                         # Clean up image reference to prevent memory leak
-                        img_ref = self.file_widgets[fp].get("image_ref")
-                        if img_ref and img_ref in self.image_refs:
-                            self.image_refs.remove(img_ref)
+                        self.image_refs.pop(fp, None)
                         del self.file_widgets[fp]
             if group in self.groups:
                 self.groups.remove(group)
+            if group is self._misc_group:
+                self._misc_group = None
             group.destroy()
 
     def _delete_file(self, filepath):
@@ -250,12 +276,13 @@ class DragDropMixin:
             if filepath not in self.file_widgets:
                 self._clear_highlights()
                 return
-            group = self.file_widgets[filepath]["group"]
-            row = self.file_widgets[filepath]["row"]
+            w = self.file_widgets[filepath]
+            group = w.group
+            row = w.row
+            if w.state in ("success", "failed"):
+                group.done_count -= 1
             # Clean up image reference to prevent memory leak
-            img_ref = self.file_widgets[filepath].get("image_ref")
-            if img_ref and img_ref in self.image_refs:
-                self.image_refs.remove(img_ref)
+            self.image_refs.pop(filepath, None)
         if group.winfo_exists():
             group.remove_file(filepath)
         row.destroy()
@@ -4,6 +4,9 @@ import os
 import io
 import re
 import base64
+import hashlib
+import tempfile
+import threading
 from typing import List, Optional, Union
 from PIL import Image
 from loguru import logger
@@ -11,8 +14,23 @@ from modules.sidecar import SidecarBridge
 from modules import config
 from modules.exceptions import InvalidFileException
 
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
 # Import centralized extension validation from config
 VALID_EXTENSIONS = config.VALID_EXTENSIONS
+# Set form for O(1) lookups against os.path.splitext(...)[1].lower()
+VALID_EXTENSION_SET = frozenset(ext.lower() for ext in VALID_EXTENSIONS)
+# Width (px) requested from the sidecar for list previews
+THUMBNAIL_WIDTH = 100
+# Thumbnailed in-process via PIL draft mode instead of the sidecar
+JPEG_EXTENSIONS = frozenset((".jpg", ".jpeg"))
+# The cache is pruned once per process, on the first write (see _prune_thumbnail_cache)
+_THUMB_CACHE_PRUNED = False
+_THUMB_CACHE_PRUNE_LOCK = threading.Lock()
 
 
 def validate_file_extension(file_path: str) -> bool:
@@ -50,22 +68,26 @@ def validate_file_size(file_path: str, max_size: int = None) -> bool:
     Raises:
         InvalidFileException: If file exceeds maximum size
     """
-    if max_size is None:
-        max_size = config.MAX_FILE_SIZE
-
     try:
         file_size = os.path.getsize(file_path)
-        if file_size > max_size:
-            max_size_mb = max_size / (1024 * 1024)
-            file_size_mb = file_size / (1024 * 1024)
-            raise InvalidFileException(
-                f"File '{os.path.basename(file_path)}' is too large "
-                f"({file_size_mb:.1f}MB). Maximum allowed size is {max_size_mb:.1f}MB."
-            )
-        return True
     except OSError as e:
         logger.warning(f"Could not check file size for {file_path}: {e}")
         return True  # Allow the file if we can't check its size
+    return _check_file_size(file_path, file_size, max_size)
+
+
+def _check_file_size(file_path: str, file_size: int, max_size: int = None) -> bool:
+    """Raise InvalidFileException if an already-known file size exceeds the limit."""
+    if max_size is None:
+        max_size = config.MAX_FILE_SIZE
+    if file_size > max_size:
+        max_size_mb = max_size / (1024 * 1024)
+        file_size_mb = file_size / (1024 * 1024)
+        raise InvalidFileException(
+            f"File '{os.path.basename(file_path)}' is too large "
+            f"({file_size_mb:.1f}MB). Maximum allowed size is {max_size_mb:.1f}MB."
+        )
+    return True
 
 
 def scan_inputs(inputs: Union[str, List[str]], validate_size: bool = True) -> List[str]:
@@ -105,6 +127,10 @@ def scan_inputs(inputs: Union[str, List[str]], validate_size: bool = True) -> Li
 def get_files_from_directory(directory: str, validate_size: bool = True) -> List[str]:
     """Recursively get all valid image files from a directory.
 
+    Uses os.scandir directly so the extension test works on DirEntry.name and
+    the size check reuses DirEntry.stat() (no extra stat on Windows, cached on POSIX).
+    Traversal order matches os.walk (files of a folder, then its subfolders).
+
     Args:
         directory: Path to directory to scan
         validate_size: Whether to validate file sizes (defaults to True)
@@ -116,23 +142,49 @@ def get_files_from_directory(directory: str, validate_size: bool = True) -> List
         InvalidFileException: If any file exceeds the maximum size limit
     """
     files: List[str] = []
+    _scan_directory(directory, files, validate_size)
+    return files
+
+
+def _scan_directory(directory: str, files: List[str], validate_size: bool) -> None:
+    subdirs: List[str] = []
     try:
-        for root, _, filenames in os.walk(directory):
-            for filename in filenames:
-                if filename.lower().endswith(VALID_EXTENSIONS):
-                    file_path = os.path.join(root, filename)
-                    # Validate extension and file size
-                    validate_file_extension(file_path)
-                    if validate_size:
-                        validate_file_size(file_path)
-                    files.append(file_path)
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    # Like os.walk(followlinks=False): don't descend into symlinked folders
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                    continue
+                if os.path.splitext(entry.name)[1].lower() not in VALID_EXTENSION_SET:
+                    continue
+                if validate_size:
+                    try:
+                        file_size = entry.stat().st_size
+                    except OSError as e:
+                        logger.warning(f"Could not check file size for {entry.path}: {e}")
+                    else:
+                        _check_file_size(entry.path, file_size)
+                files.append(entry.path)
     except OSError as e:
         logger.error(f"Error scanning directory: {e}")
-    return files
+        return
+
+    for subdir in subdirs:
+        _scan_directory(subdir, files, validate_size)
 
 
 def generate_thumbnail(file_path: str) -> Optional[Image.Image]:
-    """Generate thumbnail using the Go sidecar process.
+    """Generate a list-preview thumbnail.
+
+    JPEGs are thumbnailed in-process with PIL draft mode (reduced-scale decode);
+    other formats, or JPEGs PIL can't handle, go through the sidecar. Results are
+    cached on disk under config.THUMB_CACHE_DIR, so re-adding the same images
+    skips the decode entirely.
 
     Args:
         file_path: Path to image file
@@ -140,19 +192,150 @@ def generate_thumbnail(file_path: str) -> Optional[Image.Image]:
     Returns:
         PIL Image object if successful, None otherwise
     """
-    payload = {"action": "generate_thumb", "files": [file_path], "config": {"width": "100"}}
+    cache_path = _thumbnail_cache_path(file_path, THUMBNAIL_WIDTH)
+    if cache_path:
+        try:
+            with open(cache_path, "rb") as f:
+                image = Image.open(io.BytesIO(f.read()))
+                # Image.open is lazy; decode now so a damaged entry falls through to a
+                # rebuild here instead of failing later on the Tk thread
+                image.load()
+                return image
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable cached thumbnail {cache_path}: {e}")
 
-    bridge = SidecarBridge.get()
-    resp = bridge.request_sync(payload, timeout=2)
+    image_data = None
+    if os.path.splitext(file_path)[1].lower() in JPEG_EXTENSIONS:
+        try:
+            image_data = _jpeg_draft_thumbnail(file_path, THUMBNAIL_WIDTH)
+        except Exception as e:
+            logger.debug(f"Draft thumbnail failed for {file_path}, using sidecar: {e}")
+
+    if image_data is None:
+        payload = {"action": "generate_thumb", "files": [file_path], "config": {"width": str(THUMBNAIL_WIDTH)}}
 
-    if resp.get("status") == "success" and resp.get("data"):
+        bridge = SidecarBridge.get()
+        # request_sync() serializes sidecar requests; the JPEG path above stays parallel
+        resp = bridge.request_sync(payload, timeout=2)
+        if resp.get("status") != "success" or not resp.get("data"):
+            return None
+        image_data = resp["data"]
         try:
-            image_data = base64.b64decode(resp["data"])
-            return Image.open(io.BytesIO(image_data))
+            image_data = base64.b64decode(image_data)
         except Exception as e:
             logger.warning(f"Thumbnail decode error for {file_path}: {e}")
             return None
-    return None
+
+    try:
+        image = Image.open(io.BytesIO(image_data))
+        image.load()
+    except Exception as e:
+        logger.warning(f"Thumbnail decode error for {file_path}: {e}")
+        return None
+    if cache_path:
+        _write_thumbnail_cache(cache_path, image_data)
+    return image
+
+
+def _jpeg_draft_thumbnail(file_path: str, width: int) -> Optional[bytes]:
+    """Build a JPEG thumbnail with PIL, decoding at a reduced DCT scale.
+
+    draft() lets libjpeg decode straight to 1/2, 1/4 or 1/8 size, so a large
+    photo is never fully decoded just to be shrunk to list-preview width.
+    Output matches the sidecar's (width-constrained, JPEG quality 70).
+
+    Returns:
+        Encoded JPEG bytes, or None if the file is not actually a JPEG
+    """
+    with Image.open(file_path) as im:
+        if im.format != "JPEG":
+            return None
+        height = max(1, round(im.height * width / im.width))
+        # Ask for 2x the target so the LANCZOS pass still has detail to work with
+        im.draft("RGB", (width * 2, height * 2))
+        im.thumbnail((width, height), Image.Resampling.LANCZOS)
+        thumb = im if im.mode in ("RGB", "L") else im.convert("RGB")
+        buf = io.BytesIO()
+        thumb.save(buf, "JPEG", quality=70)
+        return buf.getvalue()
+
+
+def _thumbnail_cache_path(file_path: str, width: int) -> Optional[str]:
+    """Return the cache file for a thumbnail, or None if the source can't be read.
+
+    The key hashes the first THUMB_CACHE_HASH_BYTES of the file together with its
+    size, mtime and the thumbnail width, so re-adding the same images hits the cache
+    even after they were moved or renamed, while an image edited in place gets a
+    new entry.
+    """
+    try:
+        st = os.stat(file_path)
+        with open(file_path, "rb") as f:
+            head = f.read(config.THUMB_CACHE_HASH_BYTES)
+    except OSError:
+        return None
+
+    data = head + f"|{st.st_size}|{st.st_mtime_ns}|{width}".encode()
+    if XXHASH_AVAILABLE:
+        key = xxhash.xxh128_hexdigest(data)
+    else:
+        key = hashlib.blake2b(data, digest_size=16).hexdigest()
+    return os.path.join(config.THUMB_CACHE_DIR, f"{key}.jpg")
+
+
+def _write_thumbnail_cache(cache_path: str, image_data: bytes) -> None:
+    """Store an encoded thumbnail (sidecar or draft-mode JPEG) as-is (no re-encode)."""
+    cache_dir = os.path.dirname(cache_path)
+    tmp_path = None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        _prune_thumbnail_cache(cache_dir)
+        # Unique temp file per writer: decode threads can store the same key at once
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(image_data)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug(f"Could not write thumbnail cache {cache_path}: {e}")
+        if tmp_path:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def _prune_thumbnail_cache(cache_dir: str) -> None:
+    """Delete the oldest cache entries beyond config.THUMB_CACHE_MAX_FILES (once per process)."""
+    global _THUMB_CACHE_PRUNED
+    with _THUMB_CACHE_PRUNE_LOCK:
+        if _THUMB_CACHE_PRUNED:
+            return
+        _THUMB_CACHE_PRUNED = True
+
+    entries = []
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                try:
+                    entries.append((entry.stat().st_mtime_ns, entry.path))
+                except OSError:
+                    pass
+    except OSError as e:
+        logger.debug(f"Could not scan thumbnail cache {cache_dir}: {e}")
+        return
+
+    excess = len(entries) - config.THUMB_CACHE_MAX_FILES
+    if excess <= 0:
+        return
+    entries.sort()
+    for _, path in entries[:excess]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    logger.debug(f"Pruned {excess} old thumbnail cache entries")
 
 
 def sanitize_filename(filename: str, max_length: int = 200) -> str:
@@ -30,8 +30,9 @@ Plugin Priority System:
 
 import importlib
 import inspect
+import os
 import pkgutil
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, FrozenSet, List, Tuple, Optional
 from loguru import logger
 import re
 
@@ -46,6 +47,87 @@ PRIORITY_MEDIUM = 50     # Default priority
 PRIORITY_LOW = 75        # Low priority plugins
 
 
+# Modules in modules.plugins that are infrastructure, not plugins
+_SKIP_MODULES = frozenset({"__init__", "base", "schema_renderer", "helpers"})
+
+# (module names, folder mtimes) -> (plugin classes, import errors); see _discover_plugin_classes
+_DISCOVERY_CACHE: Dict[tuple, Tuple[List[Tuple[str, str, type]], List[tuple]]] = {}
+
+
+def _discovery_key(plugin_modules: List[str]) -> tuple:
+    """Cache key for plugin discovery: the module names plus each plugin folder's mtime.
+
+    Adding or removing a plugin file changes both. In a frozen build the folder
+    may not exist on disk; the mtime is then None and the names alone decide.
+    """
+    mtimes = []
+    for path in modules.plugins.__path__:
+        try:
+            mtimes.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return tuple(plugin_modules), tuple(mtimes)
+
+
+def _discover_plugin_classes(force: bool = False) -> Tuple[List[Tuple[str, str, type]], List[tuple]]:
+    """Find every ImageHostPlugin subclass in modules.plugins.
+
+    The result is cached for the process, so each PluginManager (the UI and
+    the upload manager each create one) doesn't repeat the scan.
+
+    Args:
+        force: Ignore the cache and scan again
+
+    Returns:
+        ([(module_name, class_name, class), ...], [(module_name, None, error), ...])
+    """
+    # Use pkgutil.iter_modules which works in both dev and PyInstaller builds
+    # This is the standard way to discover modules in a package
+    plugin_modules = [
+        name for _, name, _ in pkgutil.iter_modules(modules.plugins.__path__)
+    ]
+
+    key = _discovery_key(plugin_modules)
+    if not force and key in _DISCOVERY_CACHE:
+        logger.debug("Plugin discovery: using cached results")
+        return _DISCOVERY_CACHE[key]
+
+    logger.info(f"Discovering plugins in modules.plugins package")
+    logger.debug(f"Found {len(plugin_modules)} potential plugin modules: {plugin_modules}")
+
+    plugin_classes: List[Tuple[str, str, type]] = []
+    errors: List[tuple] = []
+    for module_name in sorted(plugin_modules):
+        # Skip special files
+        if module_name in _SKIP_MODULES:
+            logger.debug(f"Skipping special module: {module_name}")
+            continue
+
+        # Skip legacy backup files
+        if module_name.endswith("_legacy"):
+            logger.debug(f"Skipping legacy file: {module_name}")
+            continue
+
+        try:
+            # Import the module (a no-op returning sys.modules' entry if already imported)
+            full_module_name = f"modules.plugins.{module_name}"
+            module = importlib.import_module(full_module_name)
+
+            # Find all classes that inherit from ImageHostPlugin
+            for name, obj in inspect.getmembers(module, inspect.isclass):
+                # Check if it's a plugin class (not the base class itself)
+                if issubclass(obj, ImageHostPlugin) and obj != ImageHostPlugin:
+                    plugin_classes.append((module_name, name, obj))
+
+        except Exception as e:
+            error_msg = f"Failed to import {module_name}: {e}"
+            logger.error(error_msg)
+            errors.append((module_name, None, str(e)))
+
+    _DISCOVERY_CACHE[key] = (plugin_classes, errors)
+    return plugin_classes, errors
+
+
 class PluginManager:
     """
     Manages image hosting plugins with automatic discovery.
@@ -75,9 +157,10 @@ class PluginManager:
     def __init__(self):
         self._plugins: Dict[str, ImageHostPlugin] = {}
         self.load_errors: List[tuple] = []  # Track failed loads
+        self.service_id_set: FrozenSet[str] = frozenset()  # Refreshed by load_plugins()
         self.load_plugins()
 
-    def load_plugins(self) -> None:
+    def load_plugins(self, force: bool = False) -> None:
         """
         Automatically discover and load all plugins from the plugins folder.
 
@@ -88,66 +171,41 @@ class PluginManager:
             4. Find classes inheriting from ImageHostPlugin
             5. Instantiate and register each plugin
 
+        Steps 1-4 are cached per process (see _discover_plugin_classes), so
+        every PluginManager after the first only instantiates the plugins.
+
+        Args:
+            force: Re-run discovery even if the plugin folder looks unchanged
+
         Plugins are sorted by:
             - metadata.priority (if defined, lower = higher priority)
             - id (alphabetically if no priority)
         """
-        logger.info(f"Discovering plugins in modules.plugins package")
+        plugin_classes, discovery_errors = _discover_plugin_classes(force)
+        self.load_errors.extend(discovery_errors)
 
-        # Use pkgutil.iter_modules which works in both dev and PyInstaller builds
-        # This is the standard way to discover modules in a package
-        plugin_modules = [
-            name for _, name, _ in pkgutil.iter_modules(modules.plugins.__path__)
-        ]
-
-        logger.debug(f"Found {len(plugin_modules)} potential plugin modules: {plugin_modules}")
+        for module_name, name, obj in plugin_classes:
+            try:
+                # Instantiate the plugin
+                instance = obj()
 
-        for module_name in sorted(plugin_modules):
-            # Skip special files
-            if module_name in ["__init__", "base", "schema_renderer", "helpers"]:
-                logger.debug(f"Skipping special module: {module_name}")
-                continue
+                # Register by plugin ID
+                plugin_id = instance.id
+                self._plugins[plugin_id] = instance
 
-            # Skip legacy backup files
-            if module_name.endswith("_legacy"):
-                logger.debug(f"Skipping legacy file: {module_name}")
-                continue
+                # Get version from metadata
+                version = instance.metadata.get("version", "unknown")
+                impl = instance.metadata.get("implementation", "unknown")
 
-            try:
-                # Import the module
-                full_module_name = f"modules.plugins.{module_name}"
-                module = importlib.import_module(full_module_name)
-
-                # Find all classes that inherit from ImageHostPlugin
-                for name, obj in inspect.getmembers(module, inspect.isclass):
-                    # Check if it's a plugin class (not the base class itself)
-                    if issubclass(obj, ImageHostPlugin) and obj != ImageHostPlugin:
-                        try:
-                            # Instantiate the plugin
-                            instance = obj()
-
-                            # Register by plugin ID
-                            plugin_id = instance.id
-                            self._plugins[plugin_id] = instance
-
-                            # Get version from metadata
-                            version = instance.metadata.get("version", "unknown")
-                            impl = instance.metadata.get("implementation", "unknown")
-
-                            logger.info(
-                                f"✓ Loaded plugin: {instance.name} "
-                                f"(v{version}, {impl}, id={plugin_id})"
-                            )
-
-                        except Exception as e:
-                            error_msg = f"Failed to instantiate {name}: {e}"
-                            logger.error(error_msg)
-                            self.load_errors.append((module_name, name, str(e)))
+                logger.info(
+                    f"✓ Loaded plugin: {instance.name} "
+                    f"(v{version}, {impl}, id={plugin_id})"
+                )
 
             except Exception as e:
-                error_msg = f"Failed to import {module_name}: {e}"
+                error_msg = f"Failed to instantiate {name}: {e}"
                 logger.error(error_msg)
-                self.load_errors.append((module_name, None, str(e)))
+                self.load_errors.append((module_name, name, str(e)))
 
         # Sort plugins by priority (if defined) or alphabetically by ID
         self._plugins = dict(
@@ -160,6 +218,9 @@ class PluginManager:
             )
         )
 
+        # Cached for O(1) membership checks (validation.validate_service_name)
+        self.service_id_set = frozenset(self._plugins)
+
         logger.info(f"Plugin discovery complete: {len(self._plugins)} plugins loaded")
 
         # Log plugin load order with priorities for debugging
@@ -253,7 +314,7 @@ class PluginManager:
         logger.info("Reloading plugins...")
         self._plugins.clear()
         self.load_errors.clear()
-        self.load_plugins()
+        self.load_plugins(force=True)
 
     @staticmethod
     def parse_version(version_str: str) -> Tuple[int, int, int]:
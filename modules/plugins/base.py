@@ -1,5 +1,6 @@
 # modules/plugins/base.py
 import abc
+from functools import cached_property
 from typing import Dict, Any, Tuple, Optional, List
 import customtkinter as ctk
 from loguru import logger
@@ -20,7 +21,7 @@ class ImageHostPlugin(abc.ABC):
 
     # --- Phase 2: Plugin Metadata ---
 
-    @property
+    @cached_property
     def metadata(self) -> Dict[str, Any]:
         """
         Plugin metadata for documentation, validation, and feature detection.
@@ -79,6 +80,10 @@ class ImageHostPlugin(abc.ABC):
             - File validation before upload
             - Credential validation
             - User guidance
+
+        Built once per instance (cached_property), so the returned dict is shared
+        between callers; treat it as read-only. Subclasses override it with
+        @cached_property too.
         """
         return {
             "version": "1.0.0",
@@ -89,7 +94,7 @@ class ImageHostPlugin(abc.ABC):
 
     # --- NEW: Schema-Based Settings (Recommended) ---
 
-    @property
+    @cached_property
     def settings_schema(self) -> List[Dict[str, Any]]:
         """
         Declarative UI schema for plugin settings.
@@ -137,6 +142,8 @@ class ImageHostPlugin(abc.ABC):
             - validate: Custom validation function
 
         If this returns an empty list, falls back to legacy render_settings().
+
+        Cached per instance like metadata; don't mutate the returned list.
         """
         return []
 
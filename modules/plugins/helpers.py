@@ -12,9 +12,13 @@ This module contains helper functions for common plugin operations:
 Used across all plugins to reduce code duplication and ensure consistency.
 """
 
+from functools import lru_cache
 from typing import Dict, Any, List, Callable, Optional, Tuple
 from loguru import logger
 
+# String spellings normalize_boolean() treats as True (compared lowercased)
+_TRUE_STRINGS = frozenset(("true", "yes", "1", "on"))
+
 
 # ============================================================================
 # Validation Helpers
@@ -343,10 +347,16 @@ def normalize_boolean(value: Any) -> bool:
     if isinstance(value, int):
         return value != 0
     if isinstance(value, str):
-        return value.lower() in ("true", "yes", "1", "on")
+        return _parse_bool_str(value)
     return bool(value)
 
 
+@lru_cache(maxsize=256)
+def _parse_bool_str(value: str) -> bool:
+    """String branch of normalize_boolean(); settings repeat a few spellings, so it's cached."""
+    return value.lower() in _TRUE_STRINGS
+
+
 def normalize_int(value: Any, default: int = 0) -> int:
     """
     Safely convert value to integer.
@@ -366,12 +376,24 @@ def normalize_int(value: Any, default: int = 0) -> int:
         >>> normalize_int(None, default=10)
         10
     """
+    if isinstance(value, str):
+        parsed = _parse_int_str(value)
+        return default if parsed is None else parsed
     try:
         return int(value)
     except (ValueError, TypeError):
         return default
 
 
+@lru_cache(maxsize=256)
+def _parse_int_str(value: str) -> Optional[int]:
+    """String branch of normalize_int() (None if unparseable), cached like _parse_bool_str()."""
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
 # ============================================================================
 # Error Handling Helpers
 # ============================================================================
@@ -7,6 +7,7 @@ Python side manages UI and configuration validation.
 """
 
 import os
+from functools import cached_property
 from typing import Dict, Any, List
 from .base import ImageHostPlugin
 from . import helpers
@@ -25,7 +26,7 @@ class ImageBamPlugin(ImageHostPlugin):
     def name(self) -> str:
         return "ImageBam"
 
-    @property
+    @cached_property
     def metadata(self) -> Dict[str, Any]:
         """Plugin metadata for ImageBam.com"""
         return {
@@ -65,7 +66,7 @@ class ImageBamPlugin(ImageHostPlugin):
             },
         }
 
-    @property
+    @cached_property
     def settings_schema(self) -> List[Dict[str, Any]]:
         """Declarative UI schema for ImageBam settings."""
         return [
@@ -7,6 +7,7 @@ Python side manages UI, configuration validation, and API key handling.
 """
 
 import os
+from functools import cached_property
 from typing import Dict, Any, List
 from .base import ImageHostPlugin
 from . import helpers
@@ -25,7 +26,7 @@ class ImgurPlugin(ImageHostPlugin):
     def name(self) -> str:
         return "Imgur"
 
-    @property
+    @cached_property
     def metadata(self) -> Dict[str, Any]:
         """Plugin metadata for Imgur"""
         return {
@@ -66,7 +67,7 @@ class ImgurPlugin(ImageHostPlugin):
             },
         }
 
-    @property
+    @cached_property
     def settings_schema(self) -> List[Dict[str, Any]]:
         """Declarative UI schema for Imgur settings."""
         return [
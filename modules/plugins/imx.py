@@ -6,6 +6,7 @@ Go-based upload plugin (upload handled by Go sidecar).
 Python side only manages UI and gallery creation.
 """
 
+from functools import cached_property
 from typing import Dict, Any, List
 from .base import ImageHostPlugin
 from . import helpers
@@ -24,7 +25,7 @@ class ImxPlugin(ImageHostPlugin):
     def name(self) -> str:
         return "IMX.to"
 
-    @property
+    @cached_property
     def metadata(self) -> Dict[str, Any]:
         """Plugin metadata for IMX.to"""
         return {
@@ -71,7 +72,7 @@ class ImxPlugin(ImageHostPlugin):
             },
         }
 
-    @property
+    @cached_property
     def settings_schema(self) -> List[Dict[str, Any]]:
         """Declarative UI schema for IMX settings."""
         return [
@@ -7,6 +7,7 @@ Python side manages UI, configuration validation, and gallery coordination.
 """
 
 import os
+from functools import cached_property
 from typing import Dict, Any, List
 from .base import ImageHostPlugin
 from . import helpers
@@ -25,7 +26,7 @@ class PixhostPlugin(ImageHostPlugin):
     def name(self) -> str:
         return "Pixhost.to"
 
-    @property
+    @cached_property
     def metadata(self) -> Dict[str, Any]:
         """Plugin metadata for Pixhost.to"""
         return {
@@ -51,7 +52,7 @@ class PixhostPlugin(ImageHostPlugin):
             },
         }
 
-    @property
+    @cached_property
     def settings_schema(self) -> List[Dict[str, Any]]:
         """
         Declarative UI schema for Pixhost settings.
@@ -7,6 +7,7 @@ Python side manages UI, configuration validation, and optional authentication.
 """
 
 import os
+from functools import cached_property
 from typing import Dict, Any, List
 from .base import ImageHostPlugin
 from . import helpers
@@ -25,7 +26,7 @@ class TurboPlugin(ImageHostPlugin):
     def name(self) -> str:
         return "TurboImageHost"
 
-    @property
+    @cached_property
     def metadata(self) -> Dict[str, Any]:
         """Plugin metadata for TurboImageHost"""
         return {
@@ -66,7 +67,7 @@ class TurboPlugin(ImageHostPlugin):
             },
         }
 
-    @property
+    @cached_property
     def settings_schema(self) -> List[Dict[str, Any]]:
         """Declarative UI schema for Turbo settings."""
         return [
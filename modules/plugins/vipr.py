@@ -7,6 +7,7 @@ Includes custom gallery refresh button functionality.
 """
 
 import threading
+from functools import cached_property
 from typing import Dict, Any, List
 import customtkinter as ctk
 from .base import ImageHostPlugin
@@ -32,7 +33,7 @@ class ViprPlugin(ImageHostPlugin):
     def name(self) -> str:
         return "Vipr.im"
 
-    @property
+    @cached_property
     def metadata(self) -> Dict[str, Any]:
         """Plugin metadata for Vipr.im"""
         return {
@@ -73,7 +74,7 @@ class ViprPlugin(ImageHostPlugin):
             },
         }
 
-    @property
+    @cached_property
     def settings_schema(self) -> List[Dict[str, Any]]:
         """Declarative UI schema for Vipr settings."""
         return [
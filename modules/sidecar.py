@@ -5,14 +5,57 @@ import queue
 import os
 import sys
 import time
-from typing import Dict, Any, Optional, List
+from collections import deque
+from typing import Dict, Any, Optional, List, Union
 from . import config
 from loguru import logger
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # --- ADD THIS LINE ---
 from modules import config 
 # ---------------------
 
+class EventInbox:
+    """Sidecar event listener with a lock-free append and a wake-up Event.
+
+    Registered with SidecarBridge.add_listener like a queue (the bridge only
+    calls put()). The consumer takes everything that arrived since its last
+    call with drain(), so a burst of events costs one wake-up rather than one
+    Queue.get() (mutex + condition variables) per event. Unbounded, so the
+    bridge's reader thread never blocks on a slow consumer.
+    """
+
+    __slots__ = ("_items", "_signal")
+
+    def __init__(self) -> None:
+        self._items: deque = deque()
+        self._signal = threading.Event()
+
+    def put(self, item: Any) -> None:
+        self._items.append(item)
+        self._signal.set()
+
+    def drain(self, timeout: Optional[float] = None) -> List[Any]:
+        """Wait up to timeout for events, then return all pending ones (oldest first)."""
+        if not self._signal.wait(timeout):
+            return []
+        # Clear before popping: anything appended from here on re-sets the signal
+        self._signal.clear()
+        items = []
+        pop = self._items.popleft
+        try:
+            while True:
+                items.append(pop())
+        except IndexError:
+            pass
+        return items
+
+
 class SidecarBridge:
     _instance: Optional["SidecarBridge"] = None
     # ... rest of the file
@@ -32,13 +75,15 @@ class SidecarBridge:
     def __init__(self) -> None:
         self.proc: Optional[subprocess.Popen] = None
         self.cmd_lock: threading.Lock = threading.Lock()
+        # Replies carry no request id, so only one request_sync may be in flight
+        self.request_lock: threading.Lock = threading.Lock()
         self.restart_lock: threading.Lock = threading.Lock()
         self.restart_count: int = 0
         self.max_restarts: int = config.SIDECAR_MAX_RESTARTS
         self.restart_delay: int = config.SIDECAR_RESTART_DELAY_SECONDS
 
         # Event distribution
-        self.listeners: List[queue.Queue] = []
+        self.listeners: List[Union[queue.Queue, EventInbox]] = []
         self.listeners_lock: threading.Lock = threading.Lock()
 
         self._start_process()
@@ -112,13 +157,13 @@ class SidecarBridge:
         except Exception as e:
             logger.error(f"Failed to start sidecar: {e}")
 
-    def add_listener(self, q: queue.Queue) -> None:
-        """Registers a queue to receive all events from the sidecar."""
+    def add_listener(self, q: Union[queue.Queue, EventInbox]) -> None:
+        """Registers a queue (or EventInbox) to receive all events from the sidecar."""
         with self.listeners_lock:
             if q not in self.listeners:
                 self.listeners.append(q)
 
-    def remove_listener(self, q: queue.Queue) -> None:
+    def remove_listener(self, q: Union[queue.Queue, EventInbox]) -> None:
         """Unregisters a queue."""
         with self.listeners_lock:
             if q in self.listeners:
@@ -207,6 +252,17 @@ class SidecarBridge:
                     pass
 
     def send_cmd(self, payload: Dict[str, Any]) -> None:
+        self.send_batch([payload])
+
+    def send_batch(self, payloads: List[Dict[str, Any]]) -> None:
+        """Send several commands with a single pipe write and flush.
+
+        The sidecar reads newline-delimited JSON, so a batch is simply the
+        commands joined by newlines and needs no protocol support on the Go side.
+        """
+        if not payloads:
+            return
+
         # Check if process is alive, restart if needed
         if not self._is_process_alive():
             logger.warning("Sidecar not running, attempting restart...")
@@ -218,9 +274,15 @@ class SidecarBridge:
 
         with self.cmd_lock:
             try:
-                json.dump(payload, self.proc.stdin)
-                self.proc.stdin.write("\n")
-                self.proc.stdin.flush()
+                if ORJSON_AVAILABLE:
+                    # orjson emits UTF-8 bytes directly; bypass the text layer (always
+                    # flushed below, so it never holds pending data)
+                    stdin = self.proc.stdin.buffer
+                    stdin.write(b"".join(orjson.dumps(p, option=orjson.OPT_APPEND_NEWLINE) for p in payloads))
+                else:
+                    stdin = self.proc.stdin
+                    stdin.write("".join(json.dumps(p) + "\n" for p in payloads))
+                stdin.flush()
             except Exception as e:
                 logger.error(f"Send error: {e}")
                 # If send fails, process might be dead - trigger recovery
@@ -230,26 +292,31 @@ class SidecarBridge:
         """
         Sends a command and waits for a specific response.
         Used for login/verification/scraping.
-        """
-        temp_q = queue.Queue(maxsize=100)
-        self.add_listener(temp_q)
-        self.send_cmd(payload)
 
-        response = {"status": "error", "msg": "Timeout"}
+        The reply is the first result/data/error/success event after the send,
+        so calls are serialized on request_lock; concurrent callers (thumbnails,
+        gallery creation, login checks) would otherwise take each other's replies.
+        """
+        with self.request_lock:
+            temp_q = queue.Queue(maxsize=100)
+            self.add_listener(temp_q)
+            self.send_cmd(payload)
 
-        try:
-            # Simple heuristic: wait for 'result', 'data', or 'error'
-            while True:
-                item = temp_q.get(timeout=timeout)
-                if item.get("type") in ["result", "data", "error", "success"]:
-                    response = item
-                    break
-        except queue.Empty:
-            pass
-        finally:
-            self.remove_listener(temp_q)
+            response = {"status": "error", "msg": "Timeout"}
 
-        return response
+            try:
+                # Simple heuristic: wait for 'result', 'data', or 'error'
+                while True:
+                    item = temp_q.get(timeout=timeout)
+                    if item.get("type") in ["result", "data", "error", "success"]:
+                        response = item
+                        break
+            except queue.Empty:
+                pass
+            finally:
+                self.remove_listener(temp_q)
+
+            return response
 
     def shutdown(self) -> None:
         """Gracefully shutdown the sidecar process."""
@@ -10,6 +10,12 @@ import webbrowser
 import tempfile
 from loguru import logger
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Local imports
 from . import config
 from .widgets import MouseWheelComboBox
@@ -56,16 +62,24 @@ class TemplateManager:
     def load(self):
         if os.path.exists(self.filepath):
             try:
-                with open(self.filepath, "r") as f:
-                    saved = json.load(f)
-                    self.templates.update(saved)
+                # Single binary read: bytes input is orjson's fastest path
+                with open(self.filepath, "rb") as f:
+                    raw = f.read()
+                saved = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+                self.templates.update(saved)
             except Exception as e:
                 logger.error(f"Error loading templates: {e}")
 
     def save(self):
         try:
-            with open(self.filepath, "w") as f:
-                json.dump(self.templates, f, indent=4)
+            # Same on-disk layout either way: orjson only supports 2-space indents, and it
+            # writes non-ASCII as UTF-8 rather than \u escapes
+            if ORJSON_AVAILABLE:
+                with open(self.filepath, "wb") as f:
+                    f.write(orjson.dumps(self.templates, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.filepath, "w", encoding="utf-8") as f:
+                    json.dump(self.templates, f, indent=2, ensure_ascii=False)
         except Exception as e:
             logger.error(f"Error saving templates: {e}")
 
@@ -12,14 +12,16 @@ from PIL import Image, ImageTk
 import threading
 import queue
 import os
+import stat
 import sys
-import keyring
-import pyperclip
 import subprocess
 import platform
 import time
 import re
+import weakref
+from collections import deque
 from datetime import datetime
+from functools import partial
 from typing import Dict, Any
 from concurrent.futures import ThreadPoolExecutor
 from modules.ui.safe_scrollable_frame import SafeScrollableFrame
@@ -27,10 +29,9 @@ from modules.ui.safe_scrollable_frame import SafeScrollableFrame
 # Local Imports
 from modules import config
 from modules import api
-from modules.widgets import ScrollableFrame, LogWindow, CollapsibleGroupFrame, ServiceSettingsView
-from modules.gallery_manager import GalleryManager
+from modules.widgets import ScrollableFrame, LogWindow, CollapsibleGroupFrame, ServiceSettingsView, FileWidget
 from modules.settings_manager import SettingsManager
-from modules.template_manager import TemplateManager, TemplateEditor
+from modules.template_manager import TemplateManager
 from modules.upload_manager import UploadManager
 from modules.utils import ContextUtils
 from modules import viper_api
@@ -39,9 +40,9 @@ from modules.dnd import DragDropMixin
 from modules.credentials_manager import CredentialsManager
 from modules.auto_poster import AutoPoster
 from modules.plugin_manager import PluginManager
-from .safe_scrollable_frame import SafeScrollableFrame
 from loguru import logger
 
+_INT_RE = re.compile(r"-?\d+")
 
 
 class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
@@ -84,21 +85,38 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
         self.var_show_previews = tk.BooleanVar(value=True)
         self.var_separate_batches = tk.BooleanVar(value=False)
         self.var_appearance_mode = tk.StringVar(value="System")
+        self._thread_vars = ()  # Populated by ServiceSettingsView
+        self._service_thumb_vars = {}  # Populated by ServiceSettingsView
         self.thumb_executor = ThreadPoolExecutor(max_workers=config.THUMBNAIL_WORKERS)
+        # Per-file thumbnail decodes fan out here; PIL releases the GIL while decoding/resizing
+        self.decode_executor = ThreadPoolExecutor(
+            max_workers=config.THUMBNAIL_DECODE_WORKERS, thread_name_prefix="thumb"
+        )
+        self.io_executor = ThreadPoolExecutor(max_workers=config.IO_WORKERS, thread_name_prefix="net")
+        # Single worker so output files are written in the order groups complete
+        self.output_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="output")
 
         # Queues for thread communication
-        self.progress_queue = queue.Queue(maxsize=1000)
-        self.ui_queue = queue.Queue(maxsize=500)
+        # progress_queue is fire-and-forget status traffic drained every UI tick, so it uses
+        # the lock-free SimpleQueue. ui_queue stays bounded: its items carry decoded thumbnails
+        # and blocking the thumbnail workers is the back-pressure that caps that memory.
+        self.progress_queue = queue.SimpleQueue()
+        self.ui_queue = queue.Queue(maxsize=config.UI_QUEUE_MAXSIZE)
         self.result_queue = queue.Queue(maxsize=1000)
         self.cancel_event = threading.Event()
+        # Set on shutdown so thumbnail workers stop waiting on a full ui_queue nobody drains
+        self.closing_event = threading.Event()
         self.lock = threading.Lock()
 
         # UI state
         self.file_widgets = {}
         self.groups = []
         self.results = []
-        self.log_cache = []
-        self.image_refs = set()  # Using set for O(1) add/remove operations
+        self.result_map = {}  # file path -> (viewer_url, thumb_url), filled as results arrive
+        self.log_cache = deque(maxlen=config.LOG_CACHE_MAX)  # Oldest lines dropped first
+        # file path -> CTkImage. FileWidget.image_ref owns the image; this weak index empties
+        # itself as rows are deleted, so no periodic sweep is needed
+        self.image_refs = weakref.WeakValueDictionary()
         self.log_window_ref = None
         self.clipboard_buffer = []
         self.upload_total = 0
@@ -111,11 +129,15 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
         """Initialize application state tracking."""
         # Batch/Group tracking
         self.group_counter = 0
+        self._last_ui_tick = 0.0
+        self._misc_group = None  # Sink for loose dropped files; cleared when the group goes away
 
         # Drag & Drop state
         self.drag_data = {"item": None, "type": None, "y_start": 0, "widget_start": None}
         self.highlighted_row = None
-        self.context_menu = tk.Menu(self, tearoff=0)
+        self._context_menus = self._build_context_menus()
+        self._pending_drops = []
+        self._drop_flush_id = None
 
         # Service-specific state
         self.vipr_galleries_map = {}
@@ -133,7 +155,11 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
         self.template_mgr = TemplateManager()
         self.upload_manager = UploadManager(self.progress_queue, self.result_queue, self.cancel_event)
 
-        self._load_credentials()
+        # Keyring credentials and saved threads are loaded after the first paint
+        # (see _deferred_startup_load); start with empty data until then
+        self.creds = {}
+        self.saved_threads_data = {}
+        self._startup_data_loaded = False
         # RenameWorker disabled - not currently used (no enqueue calls in codebase)
         # Kept in controller.py for future implementation if needed
         self.rename_worker = None
@@ -143,10 +169,22 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
         if not os.path.exists(self.central_history_path):
             os.makedirs(self.central_history_path)
 
-        self.saved_threads_data = viper_api.load_saved_threads()
-
         # Initialize AutoPoster
         self.auto_poster = AutoPoster(self.creds, self.saved_threads_data)
+        self.after_idle(self._deferred_startup_load)
+
+    def _deferred_startup_load(self):
+        """Load keyring credentials and saved threads once the window is up.
+
+        Scheduled with after_idle() from _init_managers; also called directly by
+        anything that needs the data, so it is safe to call more than once.
+        """
+        if self._startup_data_loaded:
+            return
+        self._startup_data_loaded = True
+        self._load_credentials()
+        self.saved_threads_data = viper_api.load_saved_threads()
+        self.auto_poster.saved_threads_data = self.saved_threads_data
 
     def _init_ui(self):
         """Initialize user interface (menu, layout, drag-and-drop)."""
@@ -221,12 +259,10 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
         # Start UI update loop
         self.after(config.UI_UPDATE_INTERVAL_MS, self.update_ui_loop)
 
-        # Start periodic image cleanup to prevent memory leaks
-        self.after(config.UI_CLEANUP_INTERVAL_MS, self._cleanup_orphaned_images)
-
     def _load_credentials(self):
         """Load credentials from system keyring using CredentialsManager."""
         self.creds = CredentialsManager.load_all_credentials()
+        self.auto_poster.credentials = self.creds
 
     def _create_menu(self):
         menubar = tk.Menu(self)
@@ -238,8 +274,19 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.graceful_shutdown)
 
-        tools_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Tools", menu=tools_menu)
+        # Tools and View are populated on first open via postcommand
+        self._tools_built = False
+        self._view_built = False
+        self.tools_menu = tk.Menu(menubar, tearoff=0, postcommand=self._build_tools_menu)
+        menubar.add_cascade(label="Tools", menu=self.tools_menu)
+        self.view_menu = tk.Menu(menubar, tearoff=0, postcommand=self._build_view_menu)
+        menubar.add_cascade(label="View", menu=self.view_menu)
+
+    def _build_tools_menu(self):
+        if self._tools_built:
+            return
+        self._tools_built = True
+        tools_menu = self.tools_menu
         tools_menu.add_command(label="Template Editor", command=self.open_template_editor)
         tools_menu.add_command(label="Set Credentials", command=self.open_creds_dialog)
         tools_menu.add_command(label="Manage Galleries", command=self.open_gallery_manager)
@@ -253,14 +300,17 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
                 label=f"{i} Threads",
                 value=i,
                 variable=self.menu_thread_var,
-                command=lambda n=i: self.set_global_threads(n),
+                command=partial(self.set_global_threads, i),
             )
 
         tools_menu.add_separator()
         tools_menu.add_command(label="Install Context Menu", command=ContextUtils.install_menu)
 
-        view_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="View", menu=view_menu)
+    def _build_view_menu(self):
+        if self._view_built:
+            return
+        self._view_built = True
+        view_menu = self.view_menu
         view_menu.add_command(label="Execution Log", command=self.toggle_log)
         view_menu.add_separator()
         view_menu.add_checkbutton(
@@ -273,21 +323,17 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
         view_menu.add_separator()
         appearance_menu = tk.Menu(view_menu, tearoff=0)
         view_menu.add_cascade(label="Appearance Mode", menu=appearance_menu)
-        appearance_menu.add_radiobutton(
-            label="System", variable=self.var_appearance_mode, value="System", command=self.change_appearance_mode
-        )
-        appearance_menu.add_radiobutton(
-            label="Light", variable=self.var_appearance_mode, value="Light", command=self.change_appearance_mode
-        )
-        appearance_menu.add_radiobutton(
-            label="Dark", variable=self.var_appearance_mode, value="Dark", command=self.change_appearance_mode
-        )
+        for mode in ("System", "Light", "Dark"):
+            appearance_menu.add_radiobutton(
+                label=mode, variable=self.var_appearance_mode, value=mode, command=self.change_appearance_mode
+            )
 
     def change_appearance_mode(self):
         mode = self.var_appearance_mode.get()
         ctk.set_appearance_mode(mode)
 
     def open_viper_tools(self):
+        self._deferred_startup_load()
         self.saved_threads_data = viper_api.load_saved_threads()
         viper_api.ViperToolsWindow(self, creds=self.creds, callback=self.refresh_thread_data)
 
@@ -298,18 +344,12 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
 
     def set_global_threads(self, n):
         self.menu_thread_var.set(n)
-        if hasattr(self, "var_imx_threads"):
-            self.var_imx_threads.set(n)
-        if hasattr(self, "var_pix_threads"):
-            self.var_pix_threads.set(n)
-        if hasattr(self, "var_turbo_threads"):
-            self.var_turbo_threads.set(n)
-        if hasattr(self, "var_vipr_threads"):
-            self.var_vipr_threads.set(n)
-        if hasattr(self, "var_ib_threads"):
-            self.var_ib_threads.set(n)
+        for var in self._thread_vars:
+            var.set(n)
 
     def open_template_editor(self):
+        from modules.template_manager import TemplateEditor
+
         def on_update(new_key):
             pass
 
@@ -329,37 +369,31 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
             return None, None, None
         current_service = self.var_service.get()
         size = "200"
+        var = self._service_thumb_vars.get(current_service)
         try:
-            if current_service == "imx.to":
-                size = self.var_imx_thumb.get()
-            elif current_service == "pixhost.to":
-                size = self.var_pix_thumb.get()
-            elif current_service == "turboimagehost":
-                size = self.var_turbo_thumb.get()
-            elif current_service == "vipr.im":
-                val = self.var_vipr_thumb.get()
-                size = val.split("x")[0] if "x" in val else val
-            elif current_service == "imagebam.com":
-                size = self.var_ib_thumb.get()
+            if var is not None:
+                # Vipr sizes are "WxH"; templates only need the width
+                size = var.get().split("x")[0]
         except (AttributeError, tk.TclError) as e:
             logger.debug(f"Could not get thumbnail size for {current_service}: {e}")
         return grp.files, grp.title, size
 
     def on_gallery_created(self, service, gid):
         if service == "imx.to":
-            self.ent_imx_gal.delete(0, "end")
-            self.ent_imx_gal.insert(0, gid)
+            self.var_imx_gallery_id.set(gid)
             self.var_service.set("imx.to")
             self._swap_service_frame("imx.to")
         elif service == "pixhost.to":
-            self.ent_pix_hash.delete(0, "end")
-            self.ent_pix_hash.insert(0, gid)
+            self.var_pix_gallery_hash.set(gid)
             self.var_service.set("pixhost.to")
             self._swap_service_frame("pixhost.to")
         elif service == "vipr.im":
             self.refresh_vipr_galleries(select_id=gid)
 
     def open_gallery_manager(self):
+        from modules.gallery_manager import GalleryManager
+
+        self._deferred_startup_load()
         GalleryManager(self, self.creds, callback=self.on_gallery_created)
 
     def open_creds_dialog(self):
@@ -369,6 +403,7 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
         )
 
     def refresh_vipr_galleries(self, select_id=None):
+        self._deferred_startup_load()
         if not self.creds["vipr_user"]:
             messagebox.showerror("Error", "Vipr credentials missing.")
             return
@@ -381,14 +416,20 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
                 if meta and meta.get("galleries"):
                     self.vipr_galleries_map = {g["name"]: g["id"] for g in meta["galleries"]}
                     gal_names = ["None"] + list(self.vipr_galleries_map.keys())
-                    self.after(0, lambda: self.cb_vipr_gallery.configure(values=gal_names))
+                    self.after(0, lambda: self._update_vipr_gallery_values(gal_names))
                     self.log(f"Vipr: Found {len(meta['galleries'])} galleries.")
                 else:
                     self.log("Vipr: No galleries found.")
             except Exception as e:
                 self.log(f"Vipr Error: {e}")
 
-        threading.Thread(target=_refresh, daemon=True).start()
+        self.io_executor.submit(_refresh)
+
+    def _update_vipr_gallery_values(self, gal_names):
+        # The combo only exists once the Vipr frame has been built; otherwise it
+        # picks up vipr_galleries_map when it is first constructed.
+        if "vipr.im" in self.service_frames:
+            self.cb_vipr_gallery.configure(values=gal_names)
 
     def _create_layout(self):
         main_container = ctk.CTkFrame(self)
@@ -446,7 +487,10 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
         self.service_settings_container.pack(fill="x", padx=5, pady=0)
 
         # --- REFACTOR: Delegate frame creation to ServiceSettingsView ---
-        self.settings_view = ServiceSettingsView(self.service_settings_container, self)
+        # Only the default service frame is built up front; others are built on first selection
+        self.settings_view = ServiceSettingsView(
+            self.service_settings_container, self, initial_service=default_service
+        )
 
         btn_frame = ctk.CTkFrame(self.settings_frame_container, fg_color="transparent")
         btn_frame.pack(fill="x", padx=10, pady=10)
@@ -482,10 +526,11 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
         self.overall_progress.pack(fill="x", pady=5)
 
     def _swap_service_frame(self, service_name):
+        target = self.settings_view.build(service_name)
         for frame in self.service_frames.values():
             frame.pack_forget()
-        if service_name in self.service_frames:
-            self.service_frames[service_name].pack(fill="both", expand=True, padx=5, pady=5)
+        if target is not None:
+            target.pack(fill="both", expand=True, padx=5, pady=5)
 
     def _apply_settings(self):
         s = self.settings
@@ -538,28 +583,30 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
         saved_service = s.get("service", "imx.to")
         self.var_service.set(saved_service)
         self._swap_service_frame(saved_service)
-        self.ent_imx_gal.delete(0, "end")
-        self.ent_imx_gal.insert(0, s.get("gallery_id", ""))
-        self.ent_pix_hash.delete(0, "end")
-        self.ent_pix_hash.insert(0, s.get("pix_gallery_hash", ""))
+        self.var_imx_gallery_id.set(s.get("gallery_id", ""))
+        self.var_pix_gallery_hash.set(s.get("pix_gallery_hash", ""))
 
     def _safe_int(self, value, default=2):
-        try:
-            return int(value)
-        except (ValueError, TypeError) as e:
-            logger.debug(f"Could not convert '{value}' to int, using default {default}: {e}")
-            return default
+        # Predicate check instead of int()/except: the common valid path never raises
+        if isinstance(value, int):
+            return value
+        text = str(value).strip()
+        if _INT_RE.fullmatch(text):
+            return int(text)
+        logger.debug(f"Could not convert '{value}' to int, using default {default}")
+        return default
 
     def _gather_settings(self) -> Dict[str, Any]:
-        vipr_gal_name = self.cb_vipr_gallery.get()
+        vipr_gal_name = self.var_vipr_gallery.get()
         vipr_id = self.vipr_galleries_map.get(vipr_gal_name, "0")
 
         def get_c(var):
             try:
-                return int(var.get())
-            except (ValueError, TypeError, AttributeError) as e:
-                logger.debug(f"Could not convert variable to int: {e}")
+                value = var.get()
+            except AttributeError as e:
+                logger.debug(f"Could not read variable: {e}")
                 return 0
+            return self._safe_int(value, 0)
 
         return {
             "service": self.var_service.get(),
@@ -590,8 +637,8 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
             "auto_copy": self.var_auto_copy.get(),
             "auto_gallery": self.var_auto_gallery.get(),
             "show_previews": self.var_show_previews.get(),
-            "gallery_id": self.ent_imx_gal.get(),
-            "pix_gallery_hash": self.ent_pix_hash.get(),
+            "gallery_id": self.var_imx_gallery_id.get(),
+            "pix_gallery_hash": self.var_pix_gallery_hash.get(),
             "separate_batches": self.var_separate_batches.get(),
             "appearance_mode": self.var_appearance_mode.get(),
         }
@@ -605,44 +652,62 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
         folder = filedialog.askdirectory()
         if not folder:
             return
-        has_subdirs = False
+        # One scandir pass yields both lists; DirEntry caches the file type so no extra stat per entry
+        subdirs = []
+        has_root_images = False
         try:
-            has_subdirs = any(os.path.isdir(os.path.join(folder, d)) for d in os.listdir(folder))
+            ext_set = file_handler.VALID_EXTENSION_SET
+            with os.scandir(folder) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        subdirs.append(entry.path)
+                    elif entry.is_file() and os.path.splitext(entry.name)[1].lower() in ext_set:
+                        has_root_images = True
         except OSError as e:
             logger.warning(f"Could not scan folder '{folder}' for subdirectories: {e}")
 
-        if has_subdirs:
+        if subdirs:
             if messagebox.askyesno(
                 "Recursive Scan", "Do you want to scan recursively for all subfolders containing images?"
             ):
-                dirs_to_add = []
-                for root, dirs, files in os.walk(folder):
-                    if any(f.lower().endswith(file_handler.VALID_EXTENSIONS) for f in files):
-                        dirs_to_add.append(root)
-                if dirs_to_add:
-                    dirs_to_add.sort(key=config.natural_sort_key)
-                    self._process_files(dirs_to_add)
-                else:
-                    messagebox.showinfo("Info", "No folders with supported images found.")
+                # Walk the tree off the Tk thread; results come back via after()
+                self.lbl_eta.configure(text=f"Scanning {os.path.basename(folder)}...")
+                self.thumb_executor.submit(self._scan_folder_async, folder)
                 return
 
-            subdirs = [os.path.join(folder, d) for d in os.listdir(folder) if os.path.isdir(os.path.join(folder, d))]
-            if subdirs:
-                if messagebox.askyesno(
-                    "Batch Add Groups",
-                    f"This folder contains {len(subdirs)} immediate subfolders.\nDo you want to add each as a separate group?",
-                ):
-                    self._process_files(subdirs)
-                    files_in_root = [
-                        f
-                        for f in os.listdir(folder)
-                        if os.path.isfile(os.path.join(folder, f)) and f.lower().endswith(file_handler.VALID_EXTENSIONS)
-                    ]
-                    if files_in_root:
-                        self._process_files([folder])
-                    return
+            if messagebox.askyesno(
+                "Batch Add Groups",
+                f"This folder contains {len(subdirs)} immediate subfolders.\nDo you want to add each as a separate group?",
+            ):
+                self._process_files(subdirs)
+                if has_root_images:
+                    self._process_files([folder])
+                return
         self._process_files([folder])
 
+    def _scan_folder_async(self, folder):
+        """Recursively collect subfolders containing supported images.
+
+        Runs on thumb_executor so large trees don't freeze the UI.
+        """
+        dirs_to_add = []
+        try:
+            ext_set = file_handler.VALID_EXTENSION_SET
+            for root, _, files in os.walk(folder):
+                if any(os.path.splitext(f)[1].lower() in ext_set for f in files):
+                    dirs_to_add.append(root)
+            dirs_to_add.sort(key=config.natural_sort_key)
+        except Exception as e:
+            logger.error(f"Error scanning folder '{folder}': {e}", exc_info=True)
+        self.after(0, lambda: self._on_folder_scan_complete(dirs_to_add))
+
+    def _on_folder_scan_complete(self, dirs_to_add):
+        if dirs_to_add:
+            self._process_files(dirs_to_add)
+        else:
+            self.lbl_eta.configure(text="Ready...")
+            messagebox.showinfo("Info", "No folders with supported images found.")
+
     def _process_files(self, inputs, target_group=None):
         """Process dropped or selected files/folders and add them to groups."""
         logger.info(f"📁 Processing {len(inputs)} input(s)...")
@@ -663,13 +728,18 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
                 path = os.path.normpath(path)
                 logger.debug(f"   Processing: {path}")
 
-                if os.path.isdir(path):
+                # One stat per input instead of isdir() then isfile()
+                try:
+                    st_mode = os.stat(path).st_mode
+                except OSError:
+                    st_mode = 0
+
+                if stat.S_ISDIR(st_mode):
                     folder_name = os.path.basename(path.rstrip(os.sep))
                     logger.info(f"   📂 Scanning folder: {folder_name}")
 
                     # Update status with current folder being scanned
-                    self.lbl_eta.configure(text=f"Scanning folder {idx}/{len(inputs)}: {folder_name}...")
-                    self.update_idletasks()  # Force UI update
+                    self._throttled_tick(f"Scanning folder {idx}/{len(inputs)}: {folder_name}...")
 
                     try:
                         files_in_folder = file_handler.get_files_from_directory(path)
@@ -691,8 +761,9 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
                         logger.error(f"      ✗ Error scanning folder {folder_name}: {e}", exc_info=True)
                         rejected_count += 1
 
-                elif os.path.isfile(path):
-                    if path.lower().endswith(file_handler.VALID_EXTENSIONS):
+                elif stat.S_ISREG(st_mode):
+                    ext = os.path.splitext(path)[1]
+                    if ext.lower() in file_handler.VALID_EXTENSION_SET:
                         try:
                             # Validate file size before adding to processing queue
                             file_handler.validate_file_size(path)
@@ -703,7 +774,6 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
                             logger.warning(f"      ⚠ Rejected file {os.path.basename(path)}: {e}")
                             rejected_count += 1
                     else:
-                        ext = os.path.splitext(path)[1]
                         logger.warning(f"      ⚠ Rejected (invalid extension): {os.path.basename(path)} ({ext})")
                         rejected_count += 1
                 else:
@@ -721,11 +791,13 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
                         grp = self._create_group(grp_name)
                         self.thumb_executor.submit(self._thumb_worker, [f], grp, show_previews)
                 else:
-                    misc_group = next((g for g in self.groups if g.title == "Miscellaneous"), None)
+                    misc_group = self._misc_group
                     if not misc_group:
-                        misc_group = self._create_group("Miscellaneous")
+                        misc_group = self._misc_group = self._create_group("Miscellaneous")
                     self.thumb_executor.submit(self._thumb_worker, misc_files, misc_group, show_previews)
 
+            self.update_idletasks()  # Single redraw once the scan is done
+
             # Provide user feedback
             if file_count == 0:
                 logger.warning("⚠ No valid files were processed from the drop")
@@ -750,7 +822,20 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
             self.lbl_eta.configure(text="Error processing files")
             messagebox.showerror("Processing Error", f"An error occurred while processing files:\n\n{str(e)}")
 
+    def _throttled_tick(self, text):
+        """Update the status label, forcing a redraw at most once per UI frame.
+
+        Args:
+            text: Status text to display
+        """
+        self.lbl_eta.configure(text=text)
+        now = time.monotonic()
+        if (now - self._last_ui_tick) * 1000 >= config.UI_STATUS_THROTTLE_MS:
+            self._last_ui_tick = now
+            self.update_idletasks()
+
     def _create_group(self, title):
+        self._deferred_startup_load()
         t_names = list(self.saved_threads_data.keys()) if self.saved_threads_data else []
         tpl_names = self.template_mgr.get_all_keys()
         default_tpl = self.settings.get("output_format", "BBCode")
@@ -780,25 +865,61 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
         return group
 
     def _thumb_worker(self, files, group_widget, show_previews):
-        for f in files:
-            with self.lock:
-                if f in self.file_widgets:
-                    continue
-            pil_image = None
-            if show_previews:
-                try:
-                    pil_image = file_handler.generate_thumbnail(f)
-                except Exception:
-                    pil_image = None
-            self.ui_queue.put(("add", f, pil_image, group_widget))
-            time.sleep(0.001)
+        with self.lock:
+            files = [f for f in files if f not in self.file_widgets]
+        if not show_previews:
+            # Nothing to decode: hand rows over in blocks rather than one queue item per file
+            size = config.UI_BULK_ADD_SIZE
+            for start in range(0, len(files), size):
+                if not self._put_ui(("add_bulk", files[start:start + size], None, group_widget)):
+                    return
+            return
+        # Decode in bounded chunks so a huge drop doesn't hold every thumbnail in memory
+        chunk = config.THUMBNAIL_DECODE_WORKERS * 2
+        jpeg_exts = file_handler.JPEG_EXTENSIONS
+        for start in range(0, len(files), chunk):
+            batch = files[start:start + chunk]
+            # Only JPEGs (decoded in-process) go to the pool; other formats need the
+            # sidecar, whose requests are serialized, so they run here in order instead
+            # of parking pool threads on the request lock
+            futures = [
+                self.decode_executor.submit(self._safe_thumbnail, f)
+                if os.path.splitext(f)[1].lower() in jpeg_exts else None
+                for f in batch
+            ]
+            for f, future in zip(batch, futures):
+                pil_image = future.result() if future else self._safe_thumbnail(f)
+                if not self._put_ui(("add", f, pil_image, group_widget)):
+                    return
+
+    def _put_ui(self, item):
+        """Put an item on ui_queue, blocking while it is full.
+
+        Returns False without queueing once shutdown has started, since the UI loop that
+        drains the queue is no longer running.
+        """
+        while not self.closing_event.is_set():
+            try:
+                self.ui_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    @staticmethod
+    def _safe_thumbnail(f):
+        try:
+            return file_handler.generate_thumbnail(f)
+        except Exception:
+            return None
 
     def start_upload(self) -> None:
+        self._deferred_startup_load()
         pending_by_group = {}
-        for grp in self.groups:
-            for fp in grp.files:
-                with self.lock:
-                    if self.file_widgets[fp]["state"] == "pending":
+        with self.lock:
+            for grp in self.groups:
+                for fp in grp.files:
+                    if self.file_widgets[fp].state == "pending":
                         if grp not in pending_by_group:
                             pending_by_group[grp] = []
                         pending_by_group[grp].append(fp)
@@ -823,6 +944,7 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
 
             self.cancel_event.clear()
             self.results = []
+            self.result_map = {}
             self.result_queue = queue.Queue(maxsize=1000)
             self.upload_manager.result_queue = self.result_queue
 
@@ -844,22 +966,19 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
             self.upload_count = 0
             self.is_uploading = True
 
-            for files in pending_by_group.values():
-                for fp in files:
-                    with self.lock:
-                        self.file_widgets[fp]["state"] = "queued"
+            with self.lock:
+                for files in pending_by_group.values():
+                    for fp in files:
+                        self.file_widgets[fp].state = "queued"
 
             # Reset and prepare AutoPoster
             self.auto_poster.reset()
             self.saved_threads_data = viper_api.load_saved_threads()
             self.auto_poster.saved_threads_data = self.saved_threads_data
 
-            sorted_groups = sorted(
-                self.groups,
-                key=lambda g: (
-                    self.list_container.winfo_children().index(g) if g in self.list_container.winfo_children() else 999
-                ),
-            )
+            # One winfo_children() call; the key lookup is then a dict hit per group
+            order = {child: i for i, child in enumerate(self.list_container.winfo_children())}
+            sorted_groups = sorted(self.groups, key=lambda g: order.get(g, 999))
             for i, grp in enumerate(sorted_groups):
                 grp.batch_index = i
 
@@ -908,50 +1027,98 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
                 fp, img, thumb = self.result_queue.get_nowait()
                 with self.lock:
                     self.results.append((fp, img, thumb))
+                    self.result_map[fp] = (img, thumb)
         except queue.Empty:
             pass
 
     def _process_ui_queue(self):
-        """Process UI updates from ui_queue (batch file additions)."""
-        ui_limit = config.UI_QUEUE_BATCH_SIZE
+        """Process UI updates from ui_queue (batch file additions).
+
+        Drains everything queued (at most one full queue's worth of items, so producers
+        refilling it can't keep this tick running) and lays the rows out in one pass.
+        "add" items carry one file and its thumbnail; "add_bulk" items carry a list of
+        files without previews.
+        """
+        items = []
         try:
-            while ui_limit > 0:
-                a, f, p, g = self.ui_queue.get_nowait()
-                if a == "add" and g.winfo_exists():
-                    self._create_row(f, p, g)
-                ui_limit -= 1
+            for _ in range(self.ui_queue.maxsize):
+                items.append(self.ui_queue.get_nowait())
         except queue.Empty:
             pass
+        if not items:
+            return
+
+        # Group rows by target so each group's rows are created together (Tk lays them
+        # out once, at idle)
+        by_group = {}
+        for a, f, p, g in items:
+            if a == "add":
+                by_group.setdefault(g, []).append((f, p))
+            elif a == "add_bulk":
+                by_group.setdefault(g, []).extend((fp, None) for fp in f)
+        for g, group_rows in by_group.items():
+            if not g.winfo_exists():
+                continue
+            for f, p in group_rows:
+                self._create_row(f, p, g)
+
+        # One label update per drained batch rather than per row
+        with self.lock:
+            file_count = len(self.file_widgets)
+        self.lbl_eta.configure(text=f"Files: {file_count}")
 
     def _process_progress_queue(self):
-        """Process progress updates from progress_queue (status changes, progress bars)."""
-        prog_limit = config.PROGRESS_UPDATE_BATCH_SIZE
+        """Process progress updates from progress_queue (status changes, progress bars).
+
+        Drains up to PROGRESS_UPDATE_BATCH_SIZE messages per tick. Status changes are applied
+        in order; for plain progress updates only the latest value per file is applied, and
+        each group with newly finished files has its bar refreshed once.
+        """
+        items = []
         try:
-            while prog_limit > 0:
-                item = self.progress_queue.get_nowait()
+            for _ in range(config.PROGRESS_UPDATE_BATCH_SIZE):
+                items.append(self.progress_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if not items:
+            return
+
+        latest_prog = {}
+        finished_groups = {}  # Ordered set of groups with newly finished files
+        # One lock acquire for the whole batch of state transitions; this is the Tk thread,
+        # so the widget calls inside are safe and worker threads only wait for this tick
+        with self.lock:
+            widgets = self.file_widgets
+            for item in items:
                 k = item[0]
                 if k == "register_pix_gal":
                     new_data = item[2]
                     self.pix_galleries_to_finalize.append(new_data)
-                else:
-                    f = item[1]
-                    v = item[2]
-                    if f in self.file_widgets:
-                        w = self.file_widgets[f]
-                        if k == "status":
-                            w["status"].configure(text=v)
-                            if v in ["Done", "Failed"]:
-                                with self.lock:
-                                    self.upload_count += 1
-                                w["state"] = "success" if v == "Done" else "failed"
-                                w["prog"].set(1.0)
-                                w["prog"].configure(progress_color="#34C759" if v == "Done" else "#FF3B30")
-                                self._update_group_progress(f)
-                        elif k == "prog":
-                            w["prog"].set(v)
-                prog_limit -= 1
-        except queue.Empty:
-            pass
+                    continue
+                f = item[1]
+                v = item[2]
+                if k == "prog":
+                    latest_prog[f] = v
+                elif k == "status" and f in widgets:
+                    w = widgets[f]
+                    w.status.configure(text=v)
+                    if v in ["Done", "Failed"]:
+                        latest_prog.pop(f, None)  # Final state owns the bar
+                        self.upload_count += 1
+                        if w.state not in ("success", "failed"):
+                            w.group.done_count += 1
+                        w.state = "success" if v == "Done" else "failed"
+                        w.prog.set(1.0)
+                        w.prog.configure(progress_color="#34C759" if v == "Done" else "#FF3B30")
+                        finished_groups[w.group] = None
+
+            for f, v in latest_prog.items():
+                if f in widgets:
+                    widgets[f].prog.set(v)
+
+        # Group refresh may generate output, so it runs after the lock is released
+        for group in finished_groups:
+            self._apply_group_progress(group)
 
     def _create_row(self, fp, pil_image, group_widget):
         """Create a UI row for a file with thumbnail, status, and progress bar.
@@ -969,8 +1136,9 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
             img_widget = ctk.CTkImage(light_image=pil_image, dark_image=pil_image, size=config.UI_THUMB_SIZE)
             l = ctk.CTkLabel(row, image=img_widget, text="")
             l.pack(side="left", padx=5)
-            self.image_refs.add(img_widget)
+            self.image_refs[fp] = img_widget
         else:
+            self.image_refs.pop(fp, None)  # Row rebuilt without a preview (e.g. moved between groups)
             ctk.CTkLabel(row, text="[Img]", width=40).pack(side="left")
         st = ctk.CTkLabel(row, text="Wait", width=60)
         st.pack(side="left")
@@ -979,16 +1147,13 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
         pr.set(0)
         pr.pack(side="right", padx=5)
         with self.lock:
-            self.file_widgets[fp] = {
-                "row": row,
-                "status": st,
-                "prog": pr,
-                "state": "pending",
-                "group": group_widget,
-                "image_ref": img_widget  # Store reference for cleanup
-            }
-            file_count = len(self.file_widgets)
-        self.lbl_eta.configure(text=f"Files: {file_count}")
+            self.file_widgets[fp] = FileWidget(
+                row=row,
+                status=st,
+                prog=pr,
+                group=group_widget,
+                image_ref=img_widget,  # Store reference for cleanup
+            )
 
         def bind_row(w):
             w.bind("<Button-1>", lambda e, w=row, f=fp: self._on_row_drag_start(e, w, f))
@@ -1003,22 +1168,19 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
 
     def _update_group_progress(self, fp):
         with self.lock:
-            if fp not in self.file_widgets:
+            w = self.file_widgets.get(fp)
+            if w is None:
                 return
+            group = w.group
+        self._apply_group_progress(group)
+
+    def _apply_group_progress(self, group):
+        """Refresh a group's bar from its done_count (O(1), no scan of group.files)."""
         try:
-            with self.lock:
-                group = self.file_widgets[fp]["group"]
-            if not group.winfo_exists():
-                return
+            done = group.done_count
             total = len(group.files)
-            if total == 0:
+            if total == 0 or not group.winfo_exists():
                 return
-            done = 0
-            for f in group.files:
-                with self.lock:
-                    if f in self.file_widgets:
-                        if self.file_widgets[f]["state"] in ["success", "failed"]:
-                            done += 1
             group.prog.set(done / total)
             group.lbl_counts.configure(text=f"({done}/{total})")
             if done == total and not group.is_completed:
@@ -1031,11 +1193,9 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
         if not self.is_uploading:
             return
         self.lbl_eta.configure(text="Finalizing...")
-
-        def _fin():
-            self.after(0, self._on_upload_complete)
-
-        threading.Thread(target=_fin, daemon=True).start()
+        # Queued behind the output writes (single worker), so their results are in
+        # current_output_files before the completion dialog checks it
+        self.output_executor.submit(self.after, 0, self._on_upload_complete)
 
     def _on_upload_complete(self):
         self.is_uploading = False
@@ -1045,10 +1205,7 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
         self.overall_progress.configure(progress_color="#34C759")
         self.lbl_eta.configure(text="All batches finished.")
         if self.var_auto_copy.get() and self.clipboard_buffer:
-            try:
-                pyperclip.copy("\n\n".join(self.clipboard_buffer))
-            except (OSError, pyperclip.PyperclipException) as e:
-                logger.warning(f"Could not copy to clipboard: {e}")
+            self._copy_to_clipboard("\n\n".join(self.clipboard_buffer))
         if self.current_output_files:
             self.btn_open.configure(state="normal")
             msg = "Output files created."
@@ -1056,18 +1213,26 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
                 msg += " All output text copied to clipboard."
             messagebox.showinfo("Done", msg)
 
+    def _copy_to_clipboard(self, text):
+        """Copy text using Tk's own clipboard (no helper process or DLL load)."""
+        try:
+            self.clipboard_clear()
+            self.clipboard_append(text)
+            self.update_idletasks()
+        except tk.TclError as e:
+            logger.warning(f"Could not copy to clipboard: {e}")
+
     def stop_upload(self):
-        self.cancel_event.set()
+        self.upload_manager.cancel()
         self.lbl_eta.configure(text="Stopping...")
 
     def generate_group_output(self, group):
-        res_map = {r[0]: (r[1], r[2]) for r in self.results}
         group_results = []
         svc = self.settings.get("service", "")
 
         for fp in group.files:
-            if fp in res_map:
-                val = res_map[fp]
+            val = self.result_map.get(fp)
+            if val:
                 viewer_url = val[0]
                 thumb_url = val[1]
                 direct_url = viewer_url
@@ -1111,30 +1276,19 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
             safe_title = sanitize_filename(group.title)
             ts = datetime.now().strftime("%Y%m%d_%H%M")
             out_dir = "Output"
-            os.makedirs(out_dir, exist_ok=True)
             out_name = os.path.join(out_dir, f"{safe_title}_{ts}.txt")
-            with open(out_name, "w", encoding="utf-8") as f:
-                f.write(text)
-            self.current_output_files.append(out_name)
-            self.log(f"Saved: {out_name}")
+            central_name = os.path.join(self.central_history_path, f"{safe_title}_{ts}.txt")
+            # (path, text, log label); the central history copy isn't logged
+            writes = [(out_name, text, "Saved"), (central_name, text, None)]
 
             # Queue for auto-posting if needed
             tgt_thread = group.selected_thread
             if tgt_thread and tgt_thread != "Do Not Post":
                 self.auto_poster.queue_post(group.batch_index, text, tgt_thread)
 
-            central_name = os.path.join(self.central_history_path, f"{safe_title}_{ts}.txt")
-            with open(central_name, "w", encoding="utf-8") as f:
-                f.write(text)
-
-            self.lbl_eta.configure(text=f"Saved: {safe_title}_{ts}.txt")
-            self.btn_open.configure(state="normal")
             if self.var_auto_copy.get():
+                # Copied once, joined, in _on_upload_complete
                 self.clipboard_buffer.append(text)
-                try:
-                    pyperclip.copy("\n\n".join(self.clipboard_buffer))
-                except (OSError, pyperclip.PyperclipException) as e:
-                    logger.warning(f"Could not copy to clipboard: {e}")
 
             need_links_txt = False
             if svc == "imx.to" and self.var_imx_links.get():
@@ -1149,20 +1303,54 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
             if need_links_txt:
                 links_name = os.path.join(out_dir, f"{safe_title}_{ts}_links.txt")
                 raw_links = "\n".join([r[0] for r in group_results])
-                with open(links_name, "w", encoding="utf-8") as f:
-                    f.write(raw_links)
-                self.log(f"Saved Links: {links_name}")
+                writes.append((links_name, raw_links, "Saved Links"))
+
+            # Disk writes happen off the Tk thread (slow or network Output dirs would stall the UI)
+            self.output_executor.submit(self._write_output_files, writes)
 
         except Exception as e:
             self.log(f"Error writing output: {e}")
 
+    def _write_output_files(self, writes):
+        """Write (path, text, label) triples; runs on output_executor.
+
+        Each result is reported back on the Tk thread, so the log only says a file
+        was saved once it actually was.
+        """
+        for path, text, label in writes:
+            try:
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(text)
+            except OSError as e:
+                logger.error(f"Error writing output {path}: {e}")
+                self.after(0, lambda p=path, err=e: self.log(f"Error writing output {p}: {err}"))
+                continue
+            if label:
+                self.after(0, lambda p=path, lbl=label: self._on_output_written(p, lbl))
+
+    def _on_output_written(self, path, label):
+        self.log(f"{label}: {path}")
+        if label == "Saved":
+            self.current_output_files.append(path)
+            self.lbl_eta.configure(text=f"Saved: {os.path.basename(path)}")
+            self.btn_open.configure(state="normal")
+
     def open_output_folder(self):
         if self.current_output_files:
             folder = os.path.dirname(os.path.abspath(self.current_output_files[0]))
             if platform.system() == "Windows":
                 os.startfile(folder)
+            elif platform.system() == "Darwin":
+                subprocess.Popen(["open", folder])
             else:
-                subprocess.run(["xdg-open", folder], check=False, shell=False)
+                # Fire-and-forget: don't block the Tk thread while the file manager starts
+                subprocess.Popen(
+                    ["xdg-open", folder],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
+                )
 
     def toggle_log(self):
         if self.log_window_ref and self.log_window_ref.winfo_exists():
@@ -1174,10 +1362,11 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
         cnt = 0
         with self.lock:
             for w in self.file_widgets.values():
-                if w["state"] == "failed":
-                    w["status"].configure(text="Retry")
-                    w["prog"].set(0)
-                    w["state"] = "pending"
+                if w.state == "failed":
+                    w.status.configure(text="Retry")
+                    w.prog.set(0)
+                    w.state = "pending"
+                    w.group.done_count -= 1
                     cnt += 1
         if cnt:
             self.start_upload()
@@ -1193,6 +1382,7 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
         for grp in self.groups:
             grp.destroy()
         self.groups.clear()
+        self._misc_group = None
         with self.lock:
             self.file_widgets.clear()
         self.image_refs.clear()
@@ -1201,22 +1391,6 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
         self.btn_start.configure(state="normal")
         self.btn_stop.configure(state="disabled")
 
-    def _cleanup_orphaned_images(self):
-        """Periodically clean up image references that are no longer in use."""
-        with self.lock:
-            # Keep only image refs that are still in file_widgets
-            active_refs = set()
-            for widget_data in self.file_widgets.values():
-                img_ref = widget_data.get("image_ref")
-                if img_ref:
-                    active_refs.add(img_ref)
-
-            # Remove orphaned refs using set intersection (O(n) instead of O(n²))
-            self.image_refs &= active_refs
-
-        # Schedule next cleanup in 30 seconds
-        self.after(config.UI_CLEANUP_INTERVAL_MS, self._cleanup_orphaned_images)
-
     def log(self, msg):
         logger.info(msg)
         if self.log_window_ref and self.log_window_ref.winfo_exists():
@@ -1252,14 +1426,40 @@ class UploaderApp(ctk.CTk, TkinterDnD.DnDWrapper, DragDropMixin):
             except Exception as e:
                 logger.warning(f"Error stopping RenameWorker: {e}")
 
-        # Shutdown thumbnail executor
+        # Shutdown thumbnail executor. Workers blocked on a full ui_queue give up once
+        # closing_event is set, and queued scans are dropped, so the wait can't hang
+        self.closing_event.set()
         if hasattr(self, 'thumb_executor') and self.thumb_executor:
             logger.info("Shutting down thumbnail executor...")
             try:
-                self.thumb_executor.shutdown(wait=True)
+                self.thumb_executor.shutdown(wait=True, cancel_futures=True)
             except Exception as e:
                 logger.warning(f"Error shutting down thumb_executor: {e}")
 
+        # Shutdown decode pool after thumb_executor, whose workers feed it
+        if hasattr(self, 'decode_executor') and self.decode_executor:
+            logger.info("Shutting down thumbnail decode pool...")
+            try:
+                self.decode_executor.shutdown(wait=True, cancel_futures=True)
+            except Exception as e:
+                logger.warning(f"Error shutting down decode_executor: {e}")
+
+        # Flush pending output file writes
+        if hasattr(self, 'output_executor') and self.output_executor:
+            logger.info("Flushing output writes...")
+            try:
+                self.output_executor.shutdown(wait=True)
+            except Exception as e:
+                logger.warning(f"Error shutting down output_executor: {e}")
+
+        # Shutdown background I/O executor (pending refreshes are not worth waiting for)
+        if hasattr(self, 'io_executor') and self.io_executor:
+            logger.info("Shutting down I/O executor...")
+            try:
+                self.io_executor.shutdown(wait=False, cancel_futures=True)
+            except Exception as e:
+                logger.warning(f"Error shutting down io_executor: {e}")
+
         # Shutdown upload manager
         if hasattr(self, 'upload_manager') and self.upload_manager:
             logger.info("Shutting down upload manager...")
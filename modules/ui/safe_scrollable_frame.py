@@ -19,19 +19,15 @@ class SafeScrollableFrame(ctk.CTkScrollableFrame):
         Returns:
             bool: True if the widget's master is a canvas, False otherwise
         """
-        if widget is None:
-            return False
-        if isinstance(widget, str):
-            try:
-                widget = self.winfo_toplevel().nametowidget(widget)
-            except Exception:
-                return False
+        # Runs on every mousewheel event: walk the master chain iteratively
         try:
-            if widget == self._parent_canvas:
-                return True
-            elif hasattr(widget, "master") and widget.master is not None:
-                return self.check_if_master_is_canvas(widget.master)
-            else:
-                return False
+            if isinstance(widget, str):
+                widget = self.winfo_toplevel().nametowidget(widget)
+            canvas = self._parent_canvas
+            while widget is not None:
+                if widget is canvas:
+                    return True
+                widget = getattr(widget, "master", None)
+            return False
         except Exception:
             return False
@@ -4,12 +4,54 @@ import json
 import os
 import sys
 import queue
-from typing import Dict, List, Any, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from . import config
 from loguru import logger
-from .sidecar import SidecarBridge
+from .sidecar import EventInbox, SidecarBridge
 from .plugin_manager import PluginManager
 
+# Service substring -> cover count setting, checked in this order
+_COVER_COUNT_KEYS = (
+    ("imx", "imx_cover_count"),
+    ("pix", "pix_cover_count"),
+    ("turbo", "turbo_cover_count"),
+    ("vipr", "vipr_cover_count"),
+)
+
+# Cover jobs use each service's largest thumbnail size
+_COVER_THUMB_OVERRIDES = {
+    "imx_thumb": "600",
+    "pix_thumb": "500",
+    "turbo_thumb": "600",
+    "vipr_thumb": "800x800",
+    "imagebam_thumb": "300",
+}
+
+# Credential keys each service's sidecar job carries; unknown services get them all
+_SERVICE_CRED_KEYS = {
+    "imx.to": ("imx_api", "imx_user", "imx_pass"),
+    "pixhost.to": (),
+    "turboimagehost": ("turbo_user", "turbo_pass"),
+    "vipr.im": ("vipr_user", "vipr_pass"),
+    "imagebam.com": ("imagebam_user", "imagebam_pass"),
+    "imgur.com": ("imgur_client_id", "imgur_access_token"),
+}
+
+# Broken IMX thumbnail host prefix -> working one
+_IMX_THUMB_FIX = ("image.imx.to/u/t/", "i.imx.to/t/")
+
+
+# service_id -> "<prefix>_threads" config key, built once per service
+_THREADS_KEY_CACHE: Dict[str, str] = {}
+
+
+def _threads_key(service_id: str) -> str:
+    """Return the thread-count config key for a service (e.g. 'imx.to' -> 'imx_threads')."""
+    key = _THREADS_KEY_CACHE.get(service_id)
+    if key is None:
+        key = _THREADS_KEY_CACHE[service_id] = sys.intern(f"{service_id.split('.')[0]}_threads")
+    return key
+
 
 class UploadManager:
     def __init__(
@@ -24,8 +66,12 @@ class UploadManager:
         self.bridge = SidecarBridge.get()
         self.plugin_manager = PluginManager()  # For plugin-driven HTTP requests
 
-        self.event_queue: queue.Queue = queue.Queue(maxsize=1000)
+        self.event_queue: EventInbox = EventInbox()
         self.listener_thread: threading.Thread = None
+        # Per-batch wake-up token: cancel() puts it in event_queue so the listener
+        # exits at once instead of on its next drain timeout. A fresh token per batch
+        # means a stale one left by an earlier cancel can't stop a new listener.
+        self._cancel_token: object = object()
 
     def start_batch(
         self,
@@ -40,7 +86,10 @@ class UploadManager:
         self.bridge.add_listener(self.event_queue)
 
         # 2. Start listener thread to process this batch's events
-        self.listener_thread = threading.Thread(target=self._process_events, daemon=True)
+        self._cancel_token = object()
+        self.listener_thread = threading.Thread(
+            target=self._process_events, args=(self._cancel_token,), daemon=True
+        )
         self.listener_thread.start()
 
         # 3. Dispatch jobs asynchronously
@@ -52,88 +101,120 @@ class UploadManager:
         cfg: Dict[str, Any],
         creds: Dict[str, str]
     ) -> None:
-        """Sends job JSONs to the Go process via the Bridge."""
-        for group_obj, files in pending_by_group.items():
-            if self.cancel_event.is_set():
-                break
-
-            # --- FIX START: Prepare Group (Create Gallery) ---
-            # Create a copy of config so specific gallery IDs don't leak to other groups
-            group_cfg = cfg.copy()
+        """Builds every group's job JSON, then sends them to the Go process in one write.
 
-            service_id = group_cfg.get("service", "")
-            plugin = self.plugin_manager.get_plugin(service_id)
-
-            if plugin and hasattr(plugin, 'prepare_group'):
-                try:
-                    # This call creates the gallery if 'gallery_id' is empty in config
-                    # and updates group_cfg['gallery_id'] with the new ID
-                    plugin.prepare_group(group_obj, group_cfg, {}, creds)
-                except Exception as e:
-                    logger.error(f"Failed to prepare group {group_obj.title}: {e}")
-            # --- FIX END ---
-
-            # Determine configured cover count
-            svc = group_cfg.get("service", "")
-            cover_cnt = 0
+        Every group is prepared (gallery creation etc.) before any job is sent:
+        request_sync replies carry no request id, so a gallery request issued while
+        uploads are running could take a per-file upload result as its reply.
+        """
+        groups = list(pending_by_group.items())
+        if not groups:
+            return
+        cancelled = self.cancel_event.is_set
+
+        # The service is fixed for the batch: resolve its plugin hooks once
+        plugin = self.plugin_manager.get_plugin(cfg.get("service", ""))
+        prepare = getattr(plugin, "prepare_group", None)
+        build_http = getattr(plugin, "build_http_request", None)
+
+        # Cover count depends only on the service and the batch config, so resolve it once
+        svc = cfg.get("service", "")
+        cover_key = next((key for tag, key in _COVER_COUNT_KEYS if tag in svc), None)
+        cover_cnt = 0
+        if cover_key:
             try:
-                if "imx" in svc:
-                    cover_cnt = int(group_cfg.get("imx_cover_count", 0))
-                elif "pix" in svc:
-                    cover_cnt = int(group_cfg.get("pix_cover_count", 0))
-                elif "turbo" in svc:
-                    cover_cnt = int(group_cfg.get("turbo_cover_count", 0))
-                elif "vipr" in svc:
-                    cover_cnt = int(group_cfg.get("vipr_cover_count", 0))
+                cover_cnt = int(cfg.get(cover_key, 0))
             except (ValueError, TypeError) as e:
                 logger.debug(f"Could not get cover count for {svc}: {e}")
 
+        # Only ship the credentials this service uses over the pipe
+        cred_keys = _SERVICE_CRED_KEYS.get(svc)
+        job_creds = creds if cred_keys is None else {k: creds.get(k, "") for k in cred_keys}
+
+        # Serial on purpose: gallery creation is the slow part of prepare_group and
+        # request_sync only allows one sidecar request in flight anyway
+        group_cfgs = [self._prepare_group(prepare, group_obj, cfg, creds) for group_obj, _ in groups]
+
+        pending_jobs: List[Dict[str, Any]] = []
+        for (group_obj, files), group_cfg in zip(groups, group_cfgs):
+            if cancelled():
+                break
+
             covers = []
             standards = []
 
+            # A file is a cover if it sits in the group's first cover_cnt slots
+            cover_files = set(group_obj.files[:cover_cnt]) if cover_cnt > 0 else ()
             for f in files:
-                try:
-                    idx = group_obj.files.index(f)
-                    if idx < cover_cnt:
-                        covers.append(f)
-                    else:
-                        standards.append(f)
-                except ValueError:
+                if f in cover_files:
+                    covers.append(f)
+                else:
                     standards.append(f)
 
             # 1. Send Cover Job (Max Thumbnail Settings)
             if covers:
-                cover_cfg = group_cfg.copy()
-                cover_cfg["imx_thumb"] = "600"
-                cover_cfg["pix_thumb"] = "500"
-                cover_cfg["turbo_thumb"] = "600"
-                cover_cfg["vipr_thumb"] = "800x800"
-                cover_cfg["imagebam_thumb"] = "300"
-                self._send_job(covers, cover_cfg, creds)
-
-            # 2. Send Standard Job
+                cover_cfg = {**group_cfg, **_COVER_THUMB_OVERRIDES}
+                job = self._build_job(build_http, covers, cover_cfg, creds, job_creds)
+                if job:
+                    pending_jobs.append(job)
+
+            # 2. Standard Job
             if standards:
-                self._send_job(standards, group_cfg, creds)
+                job = self._build_job(build_http, standards, group_cfg, creds, job_creds)
+                if job:
+                    pending_jobs.append(job)
+
+        if cancelled():
+            return
+        self.bridge.send_batch(pending_jobs)
 
-    def _send_job(
+    def _prepare_group(
         self,
-        file_list: List[str],
+        prepare: Optional[Callable[..., None]],
+        group_obj: Any,
         cfg: Dict[str, Any],
         creds: Dict[str, str]
-    ) -> None:
-        service_id = cfg["service"]
+    ) -> Dict[str, Any]:
+        """Run the plugin's prepare_group for one group; returns that group's config."""
+        # Create a copy of config so specific gallery IDs don't leak to other groups
+        group_cfg = cfg.copy()
+        if self.cancel_event.is_set():
+            return group_cfg
+
+        if prepare:
+            try:
+                # This call creates the gallery if 'gallery_id' is empty in config
+                # and updates group_cfg['gallery_id'] with the new ID
+                prepare(group_obj, group_cfg, {}, creds)
+            except Exception as e:
+                logger.error(f"Failed to prepare group {group_obj.title}: {e}")
+        return group_cfg
 
-        # DIAGNOSTIC: Log config being sent to plugin
-        logger.info(f"_send_job for {service_id}: thumbnail_size={repr(cfg.get('thumbnail_size'))}, imx_thumb={repr(cfg.get('imx_thumb'))}")
+    def _build_job(
+        self,
+        build_http: Optional[Callable[..., Optional[Dict[str, Any]]]],
+        file_list: List[str],
+        cfg: Dict[str, Any],
+        creds: Dict[str, str],
+        job_creds: Dict[str, str]
+    ) -> Optional[Dict[str, Any]]:
+        """Build the sidecar job for one file list, or None if it can't be sent.
+
+        build_http is the batch plugin's build_http_request (None if it has none).
+        It gets the full creds; the job itself carries only job_creds.
+        On a plugin error, every file in the list is reported as failed.
+        """
+        if not file_list:
+            return None
+        service_id = cfg["service"]
 
         # NEW: Check if plugin supports generic HTTP runner
-        plugin = self.plugin_manager.get_plugin(service_id)
-        if plugin and hasattr(plugin, 'build_http_request'):
+        if build_http:
             # Try to build HTTP request spec for first file (as template)
             # Note: For file-specific fields, Go will substitute the actual file path
             try:
-                http_spec = plugin.build_http_request(
-                    file_path=file_list[0] if file_list else "",
+                http_spec = build_http(
+                    file_path=file_list[0],
                     config=cfg,
                     creds=creds
                 )
@@ -143,16 +224,16 @@ class UploadManager:
                     job_data = {
                         "action": "http_upload",
                         "service": service_id,
-                        "files": [os.path.normpath(f) for f in file_list],
-                        "creds": creds,  # Pass all creds for backward compat
-                        "config": {"threads": str(cfg.get(f"{service_id.split('.')[0]}_threads", 2))},
+                        "files": list(map(os.path.normpath, file_list)),
+                        "creds": job_creds,
+                        "config": {"threads": str(cfg.get(_threads_key(service_id), 2))},
                         "http_spec": http_spec,
                         "context_data": {},
                     }
 
-                    logger.info(f"Using generic HTTP runner for {service_id} ({len(file_list)} files)")
-                    self.bridge.send_cmd(job_data)
-                    return
+                    # Per-job, so log at DEBUG with deferred formatting (skipped entirely when filtered)
+                    logger.debug("Using generic HTTP runner for {} ({} files)", service_id, len(file_list))
+                    return job_data
 
             except Exception as e:
                 logger.error(f"Failed to build HTTP request spec for {service_id}: {e}")
@@ -160,51 +241,59 @@ class UploadManager:
                 for file_path in file_list:
                     self.result_queue.put((file_path, "", ""))
                     self.progress_queue.put(("status", file_path, "error: plugin configuration failed"))
-                return
+        return None
 
-    def _process_events(self) -> None:
-        """Reads events from the bridge and updates queues."""
-        while not self.cancel_event.is_set():
-            try:
-                # Timeout allows checking cancel_event periodically
-                data = self.event_queue.get(timeout=1)
+    def cancel(self) -> None:
+        """Signal cancellation and wake the event listener immediately."""
+        self.cancel_event.set()
+        self.event_queue.put(self._cancel_token)
 
-                evt = data.get("type")
-                fp = data.get("file")
+    def _process_events(self, cancel_token: object) -> None:
+        """Reads events from the bridge and updates queues."""
+        cancelled = self.cancel_event.is_set
+        while not cancelled():
+            # cancel() wakes us with cancel_token; the timeout still catches a bare
+            # cancel_event.set(). Each wake-up takes the whole burst.
+            for data in self.event_queue.drain(timeout=1):
+                if data is cancel_token:
+                    return
+                if not isinstance(data, dict):
+                    continue  # Token from an earlier, already-finished batch
+                try:
+                    evt = data.get("type")
+                    fp = data.get("file")
 
-                if evt == "status":
-                    self.progress_queue.put(("status", fp, data.get("status")))
+                    if evt == "status":
+                        self.progress_queue.put(("status", fp, data.get("status")))
 
-                elif evt == "result":
-                    url = data.get("url")
-                    thumb = data.get("thumb")
+                    elif evt == "result":
+                        url = data.get("url")
+                        thumb = data.get("thumb")
 
-                    # --- HOTFIX: IMX Server Issue ---
-                    # Intercept broken IMX thumbnails (image.imx.to/u/t/) and fix them to i.imx.to/t/
-                    if thumb and "image.imx.to/u/t/" in thumb:
-                        thumb = thumb.replace("image.imx.to/u/t/", "i.imx.to/t/")
-                        # Optional debug log
-                        # logger.debug(f"Patched IMX thumbnail for {fp}")
-                    # --------------------------------
+                        # --- HOTFIX: IMX Server Issue ---
+                        # Intercept broken IMX thumbnails (image.imx.to/u/t/) and fix them to i.imx.to/t/
+                        # (replace() is a no-op when the prefix is absent, so no separate `in` scan)
+                        if thumb:
+                            thumb = thumb.replace(*_IMX_THUMB_FIX)
+                        # --------------------------------
 
-                    self.result_queue.put((fp, url, thumb))
+                        self.result_queue.put((fp, url, thumb))
 
-                elif evt == "batch_complete":
-                    # Optional: handle batch completion logic here if needed
-                    pass
+                    elif evt == "batch_complete":
+                        # Optional: handle batch completion logic here if needed
+                        pass
 
-            except queue.Empty:
-                continue
-            except Exception as e:
-                logger.error(f"Event processing error: {e}")
+                except Exception as e:
+                    logger.error(f"Event processing error: {e}")
 
     def shutdown(self) -> None:
         """Shutdown the upload manager gracefully."""
         # Unregister from bridge
         self.bridge.remove_listener(self.event_queue)
 
-        # Wait for listener thread to finish (it checks cancel_event)
+        # Wait for listener thread to finish (woken via its cancel token)
         if self.listener_thread and self.listener_thread.is_alive():
+            self.event_queue.put(self._cancel_token)
             self.listener_thread.join(timeout=2.0)
 
         logger.info("UploadManager shut down")
\ No newline at end of file
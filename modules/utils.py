@@ -2,8 +2,6 @@
 import sys
 import os
 import platform
-import winreg
-from tkinter import messagebox
 from loguru import logger
 
 
@@ -12,6 +10,10 @@ class ContextUtils:
     def install_menu():
         if platform.system() != "Windows":
             return
+        # Windows/GUI-only imports: keep them off the module import path
+        import winreg
+        from tkinter import messagebox
+
         try:
             key = winreg.CreateKey(winreg.HKEY_CLASSES_ROOT, r"Directory\shell\ConniesUploader")
             winreg.SetValue(key, "", winreg.REG_SZ, "Upload with Connie's Uploader")
@@ -37,6 +39,9 @@ class ContextUtils:
     def remove_menu():
         if platform.system() != "Windows":
             return
+        import winreg
+        from tkinter import messagebox
+
         try:
             winreg.DeleteKey(winreg.HKEY_CLASSES_ROOT, r"Directory\shell\ConniesUploader\command")
             winreg.DeleteKey(winreg.HKEY_CLASSES_ROOT, r"Directory\shell\ConniesUploader")
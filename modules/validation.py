@@ -1,11 +1,19 @@
 """Input validation utilities for security and data integrity."""
 
 import os
+import stat
 from pathlib import Path
 from typing import Optional
 from loguru import logger
 from modules import config
 
+# Characters sanitize_filename() replaces with "_", applied in one translate() pass
+_SANITIZE_TABLE = str.maketrans({c: "_" for c in '<>:"/\\|?*\x00'})
+# Default for validate_file_path(): O(1) extension membership
+_VALID_EXTENSION_SET = frozenset(config.VALID_EXTENSIONS)
+# Known services used by validate_service_name() when no plugin manager is given
+_FALLBACK_SERVICES = frozenset({"imx.to", "pixhost.to", "turboimagehost", "vipr.im", "imagebam.com"})
+
 
 def validate_file_path(filepath: str, allowed_extensions: tuple = None) -> Optional[str]:
     """Validate and sanitize a file path.
@@ -24,39 +32,39 @@ def validate_file_path(filepath: str, allowed_extensions: tuple = None) -> Optio
     """
     # Use centralized extensions from config if not specified
     if allowed_extensions is None:
-        allowed_extensions = config.VALID_EXTENSIONS
-    try:
-        # Resolve to absolute path and normalize
-        abs_path = Path(filepath).resolve()
-
-        # Check if file exists
-        if not abs_path.exists():
-            logger.warning(f"File does not exist: {filepath}")
-            return None
+        allowed_extensions = _VALID_EXTENSION_SET
 
-        # Ensure it's a file, not a directory or special file
-        if not abs_path.is_file():
-            logger.warning(f"Path is not a regular file: {filepath}")
-            return None
+    try:
+        # Resolve to absolute path and normalize (follows symlinks, so every
+        # check below applies to the real target)
+        abs_path = os.path.realpath(filepath)
+        # One stat covers both existence and the regular-file check
+        st = os.stat(abs_path)
+    except FileNotFoundError:
+        logger.warning(f"File does not exist: {filepath}")
+        return None
+    except (OSError, ValueError) as e:
+        logger.error(f"Error validating file path '{filepath}': {e}")
+        return None
 
-        # Validate extension if specified
-        if allowed_extensions:
-            if not abs_path.suffix.lower() in allowed_extensions:
-                logger.warning(f"Invalid file extension for {filepath}. Allowed: {allowed_extensions}")
-                return None
+    # Ensure it's a file, not a directory or special file
+    if not stat.S_ISREG(st.st_mode):
+        logger.warning(f"Path is not a regular file: {filepath}")
+        return None
 
-        # Additional security: check for suspicious patterns
-        path_str = str(abs_path)
-        if ".." in path_str or abs_path.name.startswith("."):
-            logger.warning(f"Suspicious file path pattern: {filepath}")
+    # Validate extension if specified
+    if allowed_extensions:
+        if os.path.splitext(abs_path)[1].lower() not in allowed_extensions:
+            logger.warning(f"Invalid file extension for {filepath}. Allowed: {allowed_extensions}")
             return None
 
-        return str(abs_path)
-
-    except (OSError, ValueError, RuntimeError) as e:
-        logger.error(f"Error validating file path '{filepath}': {e}")
+    # Additional security: check for suspicious patterns
+    if ".." in abs_path or os.path.basename(abs_path).startswith("."):
+        logger.warning(f"Suspicious file path pattern: {filepath}")
         return None
 
+    return abs_path
+
 
 def validate_directory_path(dirpath: str) -> Optional[str]:
     """Validate and sanitize a directory path.
@@ -102,11 +110,7 @@ def sanitize_filename(filename: str, max_length: int = 255) -> str:
         Sanitized filename
     """
     # Remove/replace dangerous characters
-    dangerous_chars = '<>:"/\\|?*\x00'
-    sanitized = filename
-
-    for char in dangerous_chars:
-        sanitized = sanitized.replace(char, "_")
+    sanitized = filename.translate(_SANITIZE_TABLE)
 
     # Remove leading/trailing dots and spaces
     sanitized = sanitized.strip(". ")
@@ -141,11 +145,11 @@ def validate_service_name(service: str, plugin_manager=None) -> bool:
     """
     # Get valid services dynamically from plugin manager if available
     if plugin_manager is not None:
-        valid_services = {plugin.service_id for plugin in plugin_manager.get_all_plugins()}
+        valid_services = plugin_manager.service_id_set
     else:
         # Fallback to hardcoded list if plugin_manager not provided
         # This ensures backward compatibility if called without plugin_manager
-        valid_services = {"imx.to", "pixhost.to", "turboimagehost", "vipr.im", "imagebam.com"}
+        valid_services = _FALLBACK_SERVICES
         logger.debug("Using fallback service list (no plugin_manager provided)")
 
     if service not in valid_services:
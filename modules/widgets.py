@@ -1,6 +1,8 @@
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import ttk
+from dataclasses import dataclass
+from typing import Any
 
 
 class ScrollableFrame(ctk.CTkScrollableFrame):
@@ -9,21 +11,16 @@ class ScrollableFrame(ctk.CTkScrollableFrame):
         self.scrollable_frame = self
 
     def check_if_master_is_canvas(self, widget):
-        if widget is None:
-            return False
-        if isinstance(widget, str):
-            try:
-                widget = self.winfo_toplevel().nametowidget(widget)
-            except Exception:
-                return False
-
+        # Runs on every mousewheel event: walk the master chain iteratively
         try:
-            if widget == self._parent_canvas:
-                return True
-            elif hasattr(widget, "master") and widget.master is not None:
-                return self.check_if_master_is_canvas(widget.master)
-            else:
-                return False
+            if isinstance(widget, str):
+                widget = self.winfo_toplevel().nametowidget(widget)
+            canvas = self._parent_canvas
+            while widget is not None:
+                if widget is canvas:
+                    return True
+                widget = getattr(widget, "master", None)
+            return False
         except Exception:
             return False
 
@@ -96,14 +93,40 @@ class ServiceSettingsView:
     Accepts the main `app` instance to attach variables to, preserving the existing data model.
     """
 
-    def __init__(self, parent, app):
+    def __init__(self, parent, app, initial_service=None):
         self.parent = parent
         self.app = app
+        self._builders = {
+            "imx.to": self._build_imx,
+            "pixhost.to": self._build_pix,
+            "turboimagehost": self._build_turbo,
+            "vipr.im": self._build_vipr,
+            "imagebam.com": self._build_imagebam,
+        }
 
         # Initialize variables on the app instance if they don't exist
         # This keeps compatibility with app._gather_settings()
         self._init_variables()
-        self._build_frames()
+
+        # Frames are built lazily on first selection; only the initial one is built now
+        self.app.service_frames = {}
+        if initial_service:
+            self.build(initial_service)
+
+    def build(self, service_name):
+        """Build the settings frame for a service if it hasn't been built yet.
+
+        Returns:
+            The service frame, or None if the service has no settings frame
+        """
+        frame = self.app.service_frames.get(service_name)
+        if frame is None:
+            builder = self._builders.get(service_name)
+            if builder is None:
+                return None
+            builder()
+            frame = self.app.service_frames[service_name]
+        return frame
 
     def _init_variables(self):
         # Global settings
@@ -121,6 +144,8 @@ class ServiceSettingsView:
             self.app.var_imx_links = ctk.BooleanVar()
         if not hasattr(self.app, "var_imx_threads"):
             self.app.var_imx_threads = ctk.IntVar(value=5)
+        if not hasattr(self.app, "var_imx_gallery_id"):
+            self.app.var_imx_gallery_id = ctk.StringVar()
 
         # Pixhost
         if not hasattr(self.app, "var_pix_content"):
@@ -133,6 +158,8 @@ class ServiceSettingsView:
             self.app.var_pix_links = ctk.BooleanVar()
         if not hasattr(self.app, "var_pix_threads"):
             self.app.var_pix_threads = ctk.IntVar(value=3)
+        if not hasattr(self.app, "var_pix_gallery_hash"):
+            self.app.var_pix_gallery_hash = ctk.StringVar()
 
         # Turbo
         if not hasattr(self.app, "var_turbo_content"):
@@ -166,6 +193,23 @@ class ServiceSettingsView:
         if not hasattr(self.app, "var_ib_threads"):
             self.app.var_ib_threads = ctk.IntVar(value=2)
 
+        # Per-service thread vars, updated together by app.set_global_threads()
+        self.app._thread_vars = (
+            self.app.var_imx_threads,
+            self.app.var_pix_threads,
+            self.app.var_turbo_threads,
+            self.app.var_vipr_threads,
+            self.app.var_ib_threads,
+        )
+        # Thumbnail-size var per service, used by app.get_preview_data()
+        self.app._service_thumb_vars = {
+            "imx.to": self.app.var_imx_thumb,
+            "pixhost.to": self.app.var_pix_thumb,
+            "turboimagehost": self.app.var_turbo_thumb,
+            "vipr.im": self.app.var_vipr_thumb,
+            "imagebam.com": self.app.var_ib_thumb,
+        }
+
     def _create_cover_count_combo(self, parent, variable, label_text="Covers:"):
         f = ctk.CTkFrame(parent, fg_color="transparent")
         f.pack(fill="x", pady=5)
@@ -175,14 +219,6 @@ class ServiceSettingsView:
         cb.pack(side="left", padx=5)
         return f
 
-    def _build_frames(self):
-        self.app.service_frames = {}
-        self._build_imx()
-        self._build_pix()
-        self._build_turbo()
-        self._build_vipr()
-        self._build_imagebam()
-
     def _build_imx(self):
         p = ctk.CTkFrame(self.parent)
         self.app.service_frames["imx.to"] = p
@@ -198,7 +234,7 @@ class ServiceSettingsView:
         self._create_cover_count_combo(p, self.app.var_imx_cover_count)
         ctk.CTkCheckBox(p, text="Links.txt", variable=self.app.var_imx_links).pack(anchor="w", pady=5)
         ctk.CTkLabel(p, text="Gallery ID:").pack(anchor="w", pady=(10, 0))
-        self.app.ent_imx_gal = ctk.CTkEntry(p)
+        self.app.ent_imx_gal = ctk.CTkEntry(p, textvariable=self.app.var_imx_gallery_id)
         self.app.ent_imx_gal.pack(fill="x")
 
     def _build_pix(self):
@@ -213,7 +249,7 @@ class ServiceSettingsView:
         self._create_cover_count_combo(p, self.app.var_pix_cover_count)
         ctk.CTkCheckBox(p, text="Links.txt", variable=self.app.var_pix_links).pack(anchor="w", pady=5)
         ctk.CTkLabel(p, text="Gallery Hash (Optional):").pack(anchor="w", pady=(10, 0))
-        self.app.ent_pix_hash = ctk.CTkEntry(p)
+        self.app.ent_pix_hash = ctk.CTkEntry(p, textvariable=self.app.var_pix_gallery_hash)
         self.app.ent_pix_hash.pack(fill="x")
 
     def _build_turbo(self):
@@ -245,7 +281,8 @@ class ServiceSettingsView:
         ctk.CTkButton(p, text="Refresh Galleries / Login", command=self.app.refresh_vipr_galleries).pack(
             fill="x", pady=10
         )
-        self.app.cb_vipr_gallery = MouseWheelComboBox(p, variable=self.app.var_vipr_gallery, values=["None"])
+        gal_names = ["None"] + list(self.app.vipr_galleries_map.keys())
+        self.app.cb_vipr_gallery = MouseWheelComboBox(p, variable=self.app.var_vipr_gallery, values=gal_names)
         self.app.cb_vipr_gallery.pack(fill="x")
 
     def _build_imagebam(self):
@@ -265,6 +302,7 @@ class CollapsibleGroupFrame(ctk.CTkFrame):
         self.is_collapsed = False
         self.is_completed = False
         self.files = []
+        self.done_count = 0  # Files in a final state (success/failed); maintained by UploaderApp
         self.selected_thread = "Do Not Post"
         self.selected_template = default_template
 
@@ -345,6 +383,18 @@ class CollapsibleGroupFrame(ctk.CTkFrame):
         self.prog.configure(progress_color="#34C759")
 
 
+@dataclass(slots=True)
+class FileWidget:
+    """Per-file UI record stored in UploaderApp.file_widgets (one per row, so slotted)."""
+
+    row: Any
+    status: Any
+    prog: Any
+    group: Any
+    state: str = "pending"
+    image_ref: Any = None
+
+
 class LogWindow(ctk.CTkToplevel):
     def __init__(self, parent, initial_logs=[]):
         super().__init__(parent)
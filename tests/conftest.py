@@ -0,0 +1,8 @@
+"""Shared pytest configuration: puts the project root on sys.path once for every test module."""
+
+import sys
+from pathlib import Path
+
+# Computed once here rather than in every test module
+_PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+sys.path.insert(0, _PROJECT_ROOT)
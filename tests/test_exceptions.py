@@ -1,11 +1,6 @@
 """Tests for modules/exceptions.py"""
 
 import pytest
-import sys
-import os
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from modules.exceptions import (
     UploaderException,
@@ -31,46 +26,38 @@ from modules.exceptions import (
 class TestExceptionHierarchy:
     """Test that exception hierarchy is correctly set up"""
 
-    def test_base_exception(self):
-        """Test UploaderException is a standard Exception"""
-        assert issubclass(UploaderException, Exception)
-
-    def test_sidecar_exceptions(self):
-        """Test sidecar exception hierarchy"""
-        assert issubclass(SidecarException, UploaderException)
-        assert issubclass(SidecarCrashException, SidecarException)
-        assert issubclass(SidecarNotFoundError, SidecarException)
-
-    def test_upload_exceptions(self):
-        """Test upload exception hierarchy"""
-        assert issubclass(UploadException, UploaderException)
-        assert issubclass(UploadFailedException, UploadException)
-
-    def test_validation_exceptions(self):
-        """Test validation exception hierarchy"""
-        assert issubclass(ValidationException, UploaderException)
-        assert issubclass(InvalidFileException, ValidationException)
-        assert issubclass(InvalidServiceException, ValidationException)
-
-    def test_plugin_exceptions(self):
-        """Test plugin exception hierarchy"""
-        assert issubclass(PluginException, UploaderException)
-        assert issubclass(PluginLoadException, PluginException)
-
-    def test_config_exceptions(self):
-        """Test config exception hierarchy"""
-        assert issubclass(ConfigException, UploaderException)
-        assert issubclass(InvalidConfigException, ConfigException)
-
-    def test_credentials_exceptions(self):
-        """Test credentials exception hierarchy"""
-        assert issubclass(CredentialsException, UploaderException)
-        assert issubclass(MissingCredentialsException, CredentialsException)
-
-    def test_network_exceptions(self):
-        """Test network exception hierarchy"""
-        assert issubclass(NetworkException, UploaderException)
-        assert issubclass(RateLimitException, NetworkException)
+    @pytest.mark.parametrize(
+        "child,parent",
+        [
+            (UploaderException, Exception),
+            # Sidecar
+            (SidecarException, UploaderException),
+            (SidecarCrashException, SidecarException),
+            (SidecarNotFoundError, SidecarException),
+            # Upload
+            (UploadException, UploaderException),
+            (UploadFailedException, UploadException),
+            # Validation
+            (ValidationException, UploaderException),
+            (InvalidFileException, ValidationException),
+            (InvalidServiceException, ValidationException),
+            # Plugin
+            (PluginException, UploaderException),
+            (PluginLoadException, PluginException),
+            # Config
+            (ConfigException, UploaderException),
+            (InvalidConfigException, ConfigException),
+            # Credentials
+            (CredentialsException, UploaderException),
+            (MissingCredentialsException, CredentialsException),
+            # Network
+            (NetworkException, UploaderException),
+            (RateLimitException, NetworkException),
+        ],
+    )
+    def test_hierarchy(self, child, parent):
+        """Test that each exception derives from its expected parent"""
+        assert issubclass(child, parent)
 
 
 class TestUploadFailedException:
@@ -123,13 +110,12 @@ class TestMissingCredentialsException:
         assert exc.service == "vipr"
         assert "vipr" in str(exc)
 
-    def test_different_services(self):
+    @pytest.mark.parametrize("service", ["pixhost", "imx", "turbo", "imagebam"])
+    def test_different_services(self, service):
         """Test exception for different services"""
-        services = ["pixhost", "imx", "turbo", "imagebam"]
-        for service in services:
-            exc = MissingCredentialsException(service)
-            assert exc.service == service
-            assert service in str(exc)
+        exc = MissingCredentialsException(service)
+        assert exc.service == service
+        assert service in str(exc)
 
 
 class TestRateLimitException:
@@ -169,12 +155,14 @@ class TestExceptionMessages:
     def test_sidecar_crash_message(self):
         """Test sidecar crash exception message"""
         exc = SidecarCrashException("Process died unexpectedly")
-        assert "unexpectedly" in str(exc).lower()
+        msg = str(exc).casefold()
+        assert "unexpectedly" in msg
 
     def test_invalid_file_message(self):
         """Test invalid file exception message"""
         exc = InvalidFileException("File too large")
-        assert "large" in str(exc).lower()
+        msg = str(exc).casefold()
+        assert "large" in msg
 
     def test_invalid_config_message(self):
         """Test invalid config exception message"""
@@ -200,16 +188,14 @@ class TestExceptionCatching:
         with pytest.raises(UploaderException):
             raise InvalidFileException("Bad file")
 
-    def test_multiple_exception_types(self):
+    @pytest.mark.parametrize(
+        "exc_class",
+        [SidecarException, UploadException, ValidationException, PluginException],
+    )
+    def test_multiple_exception_types(self, exc_class):
         """Test catching different exception types"""
-        for exc_class in [
-            SidecarException,
-            UploadException,
-            ValidationException,
-            PluginException,
-        ]:
-            with pytest.raises(UploaderException):
-                raise exc_class("Test error")
+        with pytest.raises(UploaderException):
+            raise exc_class("Test error")
 
 
 if __name__ == "__main__":
@@ -1,221 +1,283 @@
 """Tests for modules/file_handler.py"""
 
 import pytest
+import io
 import os
-import tempfile
-from pathlib import Path
 
-# Add parent directory to path for imports
-import sys
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from modules.file_handler import (
-    sanitize_filename,
-    scan_inputs,
-    get_files_from_directory,
-    VALID_EXTENSIONS
-)
+@pytest.fixture(scope="module")
+def fh():
+    """modules.file_handler, imported on first use rather than at collection.
+
+    file_handler pulls in PIL and the sidecar bridge, so deferring it keeps
+    --collect-only and -k runs that select no tests from this file cheap.
+    """
+    from modules import file_handler
+    return file_handler
 
 
 class TestSanitizeFilename:
     """Test suite for sanitize_filename function"""
 
-    def test_basic_filename(self):
-        """Test that basic filenames pass through unchanged"""
-        assert sanitize_filename("myfile") == "myfile"
-        assert sanitize_filename("my_file") == "my_file"
-        assert sanitize_filename("my-file") == "my-file"
-        assert sanitize_filename("my file") == "my_file"
-
-    def test_removes_nul_bytes(self):
-        """Test that NUL bytes are removed"""
-        assert sanitize_filename("file\x00name") == "filename"
-
-    def test_removes_control_characters(self):
-        """Test that control characters are removed"""
-        assert sanitize_filename("file\x01\x02name") == "filename"
-
-    def test_prevents_path_traversal(self):
+    # Filesystem-invalid characters that must never survive sanitization
+    _INVALID = frozenset(':*?<>|')
+
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            # Basic filenames pass through unchanged
+            ("myfile", "myfile"),
+            ("my_file", "my_file"),
+            ("my-file", "my-file"),
+            ("my file", "my_file"),
+            # NUL bytes and control characters are removed
+            ("file\x00name", "filename"),
+            ("file\x01\x02name", "filename"),
+            # Multiple spaces/underscores are collapsed
+            ("multiple    spaces", "multiple_spaces"),
+            ("multiple____underscores", "multiple_underscores"),
+            # Windows reserved names are prefixed
+            ("CON", "file_CON"),
+            ("PRN", "file_PRN"),
+            ("AUX", "file_AUX"),
+            ("NUL", "file_NUL"),
+            ("COM1", "file_COM1"),
+            ("LPT1", "file_LPT1"),
+            # Empty results get a default name
+            ("", "untitled"),
+            ("   ", "untitled"),
+            ("___", "untitled"),
+            # Leading/trailing underscores and spaces are removed
+            ("__file__", "file"),
+            ("  file  ", "file"),
+        ],
+    )
+    def test_sanitize_filename(self, fh, raw, expected):
+        """Test input -> output pairs for sanitize_filename"""
+        assert fh.sanitize_filename(raw) == expected
+
+    def test_prevents_path_traversal(self, fh):
         """Test that path traversal is prevented"""
-        assert ".." not in sanitize_filename("../etc/passwd")
-        assert "./" not in sanitize_filename("./secret")
-        assert "\\" not in sanitize_filename("..\\windows\\system32")
+        assert ".." not in fh.sanitize_filename("../etc/passwd")
+        assert "./" not in fh.sanitize_filename("./secret")
+        assert "\\" not in fh.sanitize_filename("..\\windows\\system32")
 
-    def test_removes_invalid_characters(self):
+    def test_removes_invalid_characters(self, fh):
         """Test that invalid filesystem characters are replaced"""
-        result = sanitize_filename("file:name*with?<invalid>chars|")
-        assert ":" not in result
-        assert "*" not in result
-        assert "?" not in result
-        assert "<" not in result
-        assert ">" not in result
-        assert "|" not in result
-
-    def test_collapses_multiple_spaces(self):
-        """Test that multiple spaces/underscores are collapsed"""
-        assert sanitize_filename("multiple    spaces") == "multiple_spaces"
-        assert sanitize_filename("multiple____underscores") == "multiple_underscores"
-
-    def test_windows_reserved_names(self):
-        """Test that Windows reserved names are prefixed"""
-        assert sanitize_filename("CON") == "file_CON"
-        assert sanitize_filename("PRN") == "file_PRN"
-        assert sanitize_filename("AUX") == "file_AUX"
-        assert sanitize_filename("NUL") == "file_NUL"
-        assert sanitize_filename("COM1") == "file_COM1"
-        assert sanitize_filename("LPT1") == "file_LPT1"
-
-    def test_empty_string_fallback(self):
-        """Test that empty strings get a default name"""
-        assert sanitize_filename("") == "untitled"
-        assert sanitize_filename("   ") == "untitled"
-        assert sanitize_filename("___") == "untitled"
-
-    def test_max_length_truncation(self):
+        result = fh.sanitize_filename("file:name*with?<invalid>chars|")
+        assert self._INVALID.isdisjoint(result)
+
+    def test_max_length_truncation(self, fh):
         """Test that long filenames are truncated"""
         long_name = "a" * 300
-        result = sanitize_filename(long_name, max_length=200)
+        result = fh.sanitize_filename(long_name, max_length=200)
         assert len(result) == 200
 
-    def test_strips_leading_trailing(self):
-        """Test that leading/trailing underscores are removed"""
-        assert sanitize_filename("__file__") == "file"
-        assert sanitize_filename("  file  ") == "file"
+
+@pytest.fixture(scope="session")
+def image_tree(tmp_path_factory):
+    """Read-only tree of sample files, built once for every scan test.
+
+    flat/    test1.jpg, test2.png, test3.txt
+    mixed/   image.jpg, animation.gif, document.txt
+    nested/  test1.jpg, subdir/test2.png
+    """
+    root = tmp_path_factory.mktemp("image_tree")
+    paths = {
+        "flat_jpg": root / "flat" / "test1.jpg",
+        "flat_png": root / "flat" / "test2.png",
+        "flat_txt": root / "flat" / "test3.txt",
+        "mixed_jpg": root / "mixed" / "image.jpg",
+        "mixed_gif": root / "mixed" / "animation.gif",
+        "mixed_txt": root / "mixed" / "document.txt",
+        "nested_jpg": root / "nested" / "test1.jpg",
+        "nested_png": root / "nested" / "subdir" / "test2.png",
+    }
+    for path in paths.values():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+    tree = {name: str(path) for name, path in paths.items()}
+    for name in ("flat", "mixed", "nested"):
+        tree[name] = str(root / name)
+    return tree
 
 
 class TestScanInputs:
     """Test suite for scan_inputs function"""
 
-    def test_empty_input(self):
+    def test_empty_input(self, fh):
         """Test that empty input returns empty list"""
-        assert scan_inputs([]) == []
-        assert scan_inputs(None) == []
+        assert fh.scan_inputs([]) == []
+        assert fh.scan_inputs(None) == []
 
-    def test_single_file(self):
+    def test_single_file(self, tmp_path, fh):
         """Test scanning a single valid file"""
-        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as f:
-            temp_file = f.name
-        try:
-            result = scan_inputs(temp_file)
-            assert len(result) == 1
-            assert temp_file in result
-        finally:
-            os.unlink(temp_file)
-
-    def test_invalid_extension(self):
+        temp_file = tmp_path / "single.jpg"
+        temp_file.touch()
+        temp_s = str(temp_file)
+        result = fh.scan_inputs(temp_s)
+        assert len(result) == 1
+        assert temp_s in result
+
+    def test_invalid_extension(self, image_tree, fh):
         """Test that files with invalid extensions are skipped"""
-        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
-            temp_file = f.name
-        try:
-            result = scan_inputs(temp_file)
-            assert len(result) == 0
-        finally:
-            os.unlink(temp_file)
-
-    def test_directory_scanning(self):
-        """Test scanning a directory for images"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create test files
-            jpg_file = Path(temp_dir) / "test1.jpg"
-            png_file = Path(temp_dir) / "test2.png"
-            txt_file = Path(temp_dir) / "test3.txt"
-
-            jpg_file.touch()
-            png_file.touch()
-            txt_file.touch()
+        result = fh.scan_inputs(image_tree["flat_txt"])
+        assert len(result) == 0
 
-            result = scan_inputs(temp_dir)
+    def test_directory_scanning(self, image_tree, fh):
+        """Test scanning a directory for images"""
+        result = fh.scan_inputs(image_tree["flat"])
 
-            assert len(result) == 2  # Only jpg and png
-            assert str(jpg_file) in result
-            assert str(png_file) in result
-            assert str(txt_file) not in result
+        assert len(result) == 2  # Only jpg and png
+        assert image_tree["flat_jpg"] in result
+        assert image_tree["flat_png"] in result
+        assert image_tree["flat_txt"] not in result
 
-    def test_multiple_inputs(self):
+    def test_multiple_inputs(self, image_tree, fh):
         """Test scanning multiple files"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            file1 = Path(temp_dir) / "test1.jpg"
-            file2 = Path(temp_dir) / "test2.png"
-            file1.touch()
-            file2.touch()
-
-            result = scan_inputs([str(file1), str(file2)])
-            assert len(result) == 2
+        result = fh.scan_inputs([image_tree["flat_jpg"], image_tree["flat_png"]])
+        assert len(result) == 2
 
-    def test_deduplication(self):
+    def test_deduplication(self, image_tree, fh):
         """Test that duplicate files are removed"""
-        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as f:
-            temp_file = f.name
-        try:
-            result = scan_inputs([temp_file, temp_file, temp_file])
-            assert len(result) == 1
-        finally:
-            os.unlink(temp_file)
+        temp_file = image_tree["flat_jpg"]
+        result = fh.scan_inputs([temp_file, temp_file, temp_file])
+        assert len(result) == 1
 
 
 class TestGetFilesFromDirectory:
     """Test suite for get_files_from_directory function"""
 
-    def test_empty_directory(self):
+    def test_empty_directory(self, tmp_path, fh):
         """Test scanning an empty directory"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            result = get_files_from_directory(temp_dir)
-            assert result == []
+        result = fh.get_files_from_directory(str(tmp_path))
+        assert result == []
 
-    def test_nested_directories(self):
+    def test_nested_directories(self, image_tree, fh):
         """Test that nested directories are scanned recursively"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create nested structure
-            sub_dir = Path(temp_dir) / "subdir"
-            sub_dir.mkdir()
-
-            file1 = Path(temp_dir) / "test1.jpg"
-            file2 = sub_dir / "test2.png"
-
-            file1.touch()
-            file2.touch()
+        result = fh.get_files_from_directory(image_tree["nested"])
+        assert len(result) == 2
+        assert image_tree["nested_jpg"] in result
+        assert image_tree["nested_png"] in result
 
-            result = get_files_from_directory(temp_dir)
-            assert len(result) == 2
-            assert str(file1) in result
-            assert str(file2) in result
-
-    def test_mixed_files(self):
+    def test_mixed_files(self, image_tree, fh):
         """Test directory with valid and invalid files"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            jpg_file = Path(temp_dir) / "image.jpg"
-            txt_file = Path(temp_dir) / "document.txt"
-            gif_file = Path(temp_dir) / "animation.gif"
-
-            jpg_file.touch()
-            txt_file.touch()
-            gif_file.touch()
-
-            result = get_files_from_directory(temp_dir)
-            assert len(result) == 2  # jpg and gif only
-            assert str(jpg_file) in result
-            assert str(gif_file) in result
-            assert str(txt_file) not in result
+        result = fh.get_files_from_directory(image_tree["mixed"])
+        assert len(result) == 2  # jpg and gif only
+        assert image_tree["mixed_jpg"] in result
+        assert image_tree["mixed_gif"] in result
+        assert image_tree["mixed_txt"] not in result
+
+
+class TestThumbnailCachePath:
+    """Test suite for the thumbnail cache key"""
+
+    def test_same_content_same_key(self, tmp_path, fh):
+        """Test that identical files map to the same cache entry regardless of name"""
+        file1 = tmp_path / "a.jpg"
+        file2 = tmp_path / "b.jpg"
+        file1.write_bytes(b"same bytes")
+        file2.write_bytes(b"same bytes")
+        # A move/rename keeps the mtime; give the copy the same one
+        st = file1.stat()
+        os.utime(file2, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert fh._thumbnail_cache_path(str(file1), 100) == fh._thumbnail_cache_path(str(file2), 100)
+
+    def test_different_content_or_width(self, tmp_path, fh):
+        """Test that content and thumbnail width both change the key"""
+        file1 = tmp_path / "a.jpg"
+        file2 = tmp_path / "b.jpg"
+        file1.write_bytes(b"first")
+        file2.write_bytes(b"second")
+
+        key1 = fh._thumbnail_cache_path(str(file1), 100)
+        assert key1 != fh._thumbnail_cache_path(str(file2), 100)
+        assert key1 != fh._thumbnail_cache_path(str(file1), 200)
+
+    def test_edit_in_place_changes_key(self, tmp_path, fh):
+        """Test that rewriting a file with same-size content (new mtime) changes the key"""
+        path = tmp_path / "a.jpg"
+        path.write_bytes(b"x" * 10)
+        key1 = fh._thumbnail_cache_path(str(path), 100)
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert fh._thumbnail_cache_path(str(path), 100) != key1
+
+    def test_missing_file(self, fh):
+        """Test that unreadable files are not cached"""
+        assert fh._thumbnail_cache_path("/nonexistent/file.jpg", 100) is None
+
+
+class TestThumbnailCacheWrite:
+    """Test suite for storing and pruning cached thumbnails"""
+
+    def test_write_leaves_no_temp_files(self, tmp_path, fh, monkeypatch):
+        """Test that a cache write is atomic and cleans up its temp file"""
+        monkeypatch.setattr(fh, "_THUMB_CACHE_PRUNED", True)
+        cache_path = tmp_path / "key.jpg"
+        fh._write_thumbnail_cache(str(cache_path), b"data")
+        assert cache_path.read_bytes() == b"data"
+        assert [p.name for p in tmp_path.iterdir()] == ["key.jpg"]
+
+    def test_prune_keeps_newest(self, tmp_path, fh, monkeypatch):
+        """Test that pruning removes the oldest entries beyond the cap"""
+        monkeypatch.setattr(fh, "_THUMB_CACHE_PRUNED", False)
+        monkeypatch.setattr(fh.config, "THUMB_CACHE_MAX_FILES", 2)
+        for i in range(4):
+            entry = tmp_path / f"{i}.jpg"
+            entry.write_bytes(b"x")
+            os.utime(entry, ns=(i * 10**9, i * 10**9))
+
+        fh._prune_thumbnail_cache(str(tmp_path))
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["2.jpg", "3.jpg"]
+
+
+class TestJpegDraftThumbnail:
+    """Test suite for the PIL draft-mode JPEG thumbnail path"""
+
+    def test_scales_to_width(self, tmp_path, fh):
+        """Test that a large JPEG is scaled to the requested width, keeping aspect ratio"""
+        from PIL import Image
+
+        path = tmp_path / "big.jpg"
+        Image.new("RGB", (2000, 1000), "red").save(path, "JPEG")
+
+        data = fh._jpeg_draft_thumbnail(str(path), 100)
+        thumb = Image.open(io.BytesIO(data))
+        assert thumb.format == "JPEG"
+        assert thumb.size == (100, 50)
+
+    def test_non_jpeg_content(self, tmp_path, fh):
+        """Test that a PNG with a .jpg name is left to the sidecar"""
+        from PIL import Image
+
+        path = tmp_path / "really_png.jpg"
+        Image.new("RGB", (200, 200), "blue").save(path, "PNG")
+
+        assert fh._jpeg_draft_thumbnail(str(path), 100) is None
 
 
 class TestValidExtensions:
     """Test that VALID_EXTENSIONS constant is properly defined"""
 
-    def test_valid_extensions_exists(self):
+    def test_valid_extensions_exists(self, fh):
         """Test that VALID_EXTENSIONS is defined"""
-        assert VALID_EXTENSIONS is not None
+        assert fh.VALID_EXTENSIONS is not None
 
-    def test_common_formats(self):
+    def test_common_formats(self, fh):
         """Test that common image formats are included"""
-        assert ".jpg" in VALID_EXTENSIONS
-        assert ".jpeg" in VALID_EXTENSIONS
-        assert ".png" in VALID_EXTENSIONS
-        assert ".gif" in VALID_EXTENSIONS
+        for ext in (".jpg", ".jpeg", ".png", ".gif"):
+            assert ext in fh.VALID_EXTENSION_SET
+
+    def test_extension_set_matches(self, fh):
+        """Test that the lookup set mirrors VALID_EXTENSIONS"""
+        assert fh.VALID_EXTENSION_SET == frozenset(fh.VALID_EXTENSIONS)
 
-    def test_extensions_lowercase(self):
+    def test_extensions_lowercase(self, fh):
         """Test that extensions are lowercase"""
-        for ext in VALID_EXTENSIONS:
-            assert ext == ext.lower()
+        bad = [ext for ext in fh.VALID_EXTENSIONS if ext != ext.lower()]
+        assert not bad, bad
 
 
 if __name__ == "__main__":
@@ -17,37 +17,49 @@ Usage:
 """
 
 import sys
-import os
-from typing import Dict, Any, List
-from unittest.mock import Mock, MagicMock, patch
-from dataclasses import dataclass
+import operator
+import types
+from functools import partial
+from typing import Dict, Any, List, ClassVar, Tuple
+from dataclasses import dataclass, replace
+from pathlib import Path
 import argparse
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Add parent directory to path for imports (this file also runs as a standalone script,
+# so it can't rely on tests/conftest.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from modules.plugin_manager import PluginManager
-from modules.plugins import helpers
+# modules.plugin_manager / modules.plugins.helpers are imported where they are used, so
+# pytest collecting this module doesn't load the whole plugin system
 
 
 # ============================================================================
 # Mock Data Classes
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MockFile:
     """Mock file object for testing."""
     path: str
     name: str
     size: int = 1024 * 1024  # 1MB default
 
+    @classmethod
+    def from_path(cls, path: str) -> "MockFile":
+        """Build a MockFile named after the last component of a '/'-separated mock path."""
+        return cls(path=path, name=path[path.rfind("/") + 1:])
+
     def __str__(self):
         return f"{self.name} ({self.size // 1024}KB)"
 
 
 @dataclass
 class MockGroup:
-    """Mock group object for testing."""
+    """Mock group object for testing.
+
+    Left mutable and dict-backed: like the real CollapsibleGroupFrame, plugins'
+    prepare_group() sets attributes such as gallery_id on it.
+    """
     title: str
     files: List[str]
     auto_gallery: bool = True
@@ -56,7 +68,7 @@ class MockGroup:
         return f"Group: {self.title} ({len(self.files)} files)"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MockUploadResult:
     """Mock upload result."""
     viewer_url: str
@@ -76,85 +88,96 @@ class MockUploadResult:
 # ============================================================================
 
 class MockUploadResponses:
-    """Mock upload responses for each plugin."""
+    """Mock upload responses for each plugin.
+
+    URLs come from (viewer, thumb) templates whose only variable is the
+    filename length, filled in with one str.format call each.
+    """
+
+    _TEMPLATES = {
+        "pixhost": ("https://pixhost.to/show/abc{n}def", "https://t0.pixhost.to/thumbs/abc{n}def/test.jpg"),
+        "imx": ("https://imx.to/i/i{n}xyz", "https://imx.to/t/i{n}xyz.jpg"),
+        "turbo": ("https://www.turboimagehost.com/p/turbo{n}", "https://www.turboimagehost.com/th/turbo{n}.jpg"),
+        "imagebam": ("https://www.imagebam.com/view/bam{n}img", "https://thumbs.imagebam.com/bam{n}img.jpg"),
+        "imgur": ("https://imgur.com/abc{n}XYZ", "https://i.imgur.com/abc{n}XYZm.jpg"),
+        "vipr": ("https://vipr.im/i/vipr{n}", "https://vipr.im/t/vipr{n}.jpg"),
+    }
+
+    @staticmethod
+    def _render(service: str, filename: str) -> MockUploadResult:
+        viewer, thumb = MockUploadResponses._TEMPLATES[service]
+        n = len(filename)
+        return MockUploadResult(viewer_url=viewer.format(n=n), thumb_url=thumb.format(n=n))
 
     @staticmethod
     def pixhost(filename: str) -> MockUploadResult:
         """Mock Pixhost upload response."""
-        hash_id = f"abc{len(filename)}def"
-        return MockUploadResult(
-            viewer_url=f"https://pixhost.to/show/{hash_id}",
-            thumb_url=f"https://t0.pixhost.to/thumbs/{hash_id}/test.jpg"
-        )
+        return MockUploadResponses._render("pixhost", filename)
 
     @staticmethod
     def imx(filename: str) -> MockUploadResult:
         """Mock IMX upload response."""
-        img_id = f"i{len(filename)}xyz"
-        return MockUploadResult(
-            viewer_url=f"https://imx.to/i/{img_id}",
-            thumb_url=f"https://imx.to/t/{img_id}.jpg"
-        )
+        return MockUploadResponses._render("imx", filename)
 
     @staticmethod
     def turbo(filename: str) -> MockUploadResult:
         """Mock TurboImageHost upload response."""
-        img_id = f"turbo{len(filename)}"
-        return MockUploadResult(
-            viewer_url=f"https://www.turboimagehost.com/p/{img_id}",
-            thumb_url=f"https://www.turboimagehost.com/th/{img_id}.jpg"
-        )
+        return MockUploadResponses._render("turbo", filename)
 
     @staticmethod
     def imagebam(filename: str) -> MockUploadResult:
         """Mock ImageBam upload response."""
-        img_id = f"bam{len(filename)}img"
-        return MockUploadResult(
-            viewer_url=f"https://www.imagebam.com/view/{img_id}",
-            thumb_url=f"https://thumbs.imagebam.com/{img_id}.jpg"
-        )
+        return MockUploadResponses._render("imagebam", filename)
 
     @staticmethod
     def imgur(filename: str) -> MockUploadResult:
         """Mock Imgur upload response."""
-        img_id = f"abc{len(filename)}XYZ"
-        return MockUploadResult(
-            viewer_url=f"https://imgur.com/{img_id}",
-            thumb_url=f"https://i.imgur.com/{img_id}m.jpg"
-        )
+        return MockUploadResponses._render("imgur", filename)
 
     @staticmethod
     def vipr(filename: str) -> MockUploadResult:
         """Mock Vipr upload response."""
-        img_id = f"vipr{len(filename)}"
-        return MockUploadResult(
-            viewer_url=f"https://vipr.im/i/{img_id}",
-            thumb_url=f"https://vipr.im/t/{img_id}.jpg"
-        )
+        return MockUploadResponses._render("vipr", filename)
 
 
 # ============================================================================
 # Mock Upload Simulator
 # ============================================================================
 
+# Pre-rendered progress bars, indexed by filled cell count
+_BAR_LENGTH = 30
+_BARS = ['█' * i + '░' * (_BAR_LENGTH - i) for i in range(_BAR_LENGTH + 1)]
+
+# Plugin id substring -> mock response, checked in this order (the responders are
+# static methods, so no MockUploadResponses instance is needed)
+_RESPONDERS = {
+    "pixhost": MockUploadResponses.pixhost,
+    "imx": MockUploadResponses.imx,
+    "turbo": MockUploadResponses.turbo,
+    "imagebam": MockUploadResponses.imagebam,
+    "imgur": MockUploadResponses.imgur,
+    "vipr": MockUploadResponses.vipr,
+}
+
+
 class MockUploadSimulator:
     """Simulates uploads for testing plugins."""
 
     def __init__(self, verbose: bool = False):
         self.verbose = verbose
-        self.responses = MockUploadResponses()
         self.upload_count = 0
+        self._handlers = {}  # plugin id -> resolved handler (None = generic response)
 
     def create_mock_files(self, count: int = 5) -> List[MockFile]:
         """Create mock files for testing."""
-        files = []
-        for i in range(count):
-            files.append(MockFile(
-                path=f"/mock/path/image_{i+1}.jpg",
-                name=f"image_{i+1}.jpg",
-                size=(i + 1) * 512 * 1024  # Varying sizes
-            ))
-        return files
+        return [
+            MockFile(
+                path=f"/mock/path/image_{i}.jpg",
+                name=f"image_{i}.jpg",
+                size=i * 512 * 1024  # Varying sizes
+            )
+            for i in range(1, count + 1)
+        ]
 
     def create_mock_group(self, title: str, file_count: int = 5) -> MockGroup:
         """Create mock group for testing."""
@@ -167,40 +190,34 @@ class MockUploadSimulator:
     def mock_progress_callback(self, progress: float):
         """Mock progress callback."""
         if self.verbose:
-            bar_length = 30
-            filled = int(bar_length * progress)
-            bar = '█' * filled + '░' * (bar_length - filled)
+            bar = _BARS[int(_BAR_LENGTH * progress)]
             print(f"\r  Progress: [{bar}] {progress*100:.1f}%", end='', flush=True)
 
     def simulate_upload(self, plugin, file: MockFile, group: MockGroup, config: Dict[str, Any]) -> MockUploadResult:
         """Simulate single file upload."""
         self.upload_count += 1
 
+        # Progress output is the only effect of the callback, so skip it when quiet
         if self.verbose:
             print(f"\n  Uploading: {file.name}")
             print(f"  Size: {file.size // 1024}KB")
 
-        # Simulate progress
-        for i in range(5):
-            self.mock_progress_callback((i + 1) / 5)
+            # Simulate progress
+            for i in range(5):
+                self.mock_progress_callback((i + 1) / 5)
 
-        if self.verbose:
             print()  # New line after progress
 
         # Get mock response based on plugin
         plugin_id = plugin.id
-        if 'pixhost' in plugin_id:
-            result = self.responses.pixhost(file.name)
-        elif 'imx' in plugin_id:
-            result = self.responses.imx(file.name)
-        elif 'turbo' in plugin_id:
-            result = self.responses.turbo(file.name)
-        elif 'imagebam' in plugin_id:
-            result = self.responses.imagebam(file.name)
-        elif 'imgur' in plugin_id:
-            result = self.responses.imgur(file.name)
-        elif 'vipr' in plugin_id:
-            result = self.responses.vipr(file.name)
+        try:
+            handler = self._handlers[plugin_id]
+        except KeyError:
+            handler = self._handlers[plugin_id] = next(
+                (fn for key, fn in _RESPONDERS.items() if key in plugin_id), None
+            )
+        if handler:
+            result = handler(file.name)
         else:
             result = MockUploadResult(
                 viewer_url=f"https://example.com/{file.name}",
@@ -217,14 +234,46 @@ class MockUploadSimulator:
 # Plugin Test Runner
 # ============================================================================
 
+# Group stand-in for test_helper_usage; is_cover_image() only reads .files
+_HELPER_TEST_GROUP = types.SimpleNamespace(files=["/a.jpg", "/b.jpg", "/c.jpg"])
+
+
 class PluginTestRunner:
     """Runs comprehensive plugin tests with mock uploads."""
 
+    # Settings shared by the validation and upload tests; copied per test because
+    # validate_configuration() normalizes the dict in place
+    _BASE_CONFIG: ClassVar[Dict[str, Any]] = {
+        "thumbnail_size": "180",
+        "content_type": "Safe",
+        "save_links": True,
+        "gallery_id": "",
+    }
+    # Most files any mock upload test uses (verbose mode)
+    _MAX_MOCK_FILES: ClassVar[int] = 3
+    # (label, method name) of the tests run against every plugin, in order
+    _TESTS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("Metadata", "test_plugin_metadata"),
+        ("Schema", "test_plugin_schema"),
+        ("Validation", "test_plugin_validation"),
+        ("Mock Upload", "test_plugin_upload"),
+    )
+
     def __init__(self, verbose: bool = False):
         self.verbose = verbose
         self.simulator = MockUploadSimulator(verbose)
+        from modules.plugin_manager import PluginManager
+
         self.manager = PluginManager()
         self.results = {}
+        # Bound test methods for _TESTS, built once; the upload test's file count is fixed here
+        upload = partial(self.test_plugin_upload, file_count=self._MAX_MOCK_FILES if verbose else 2)
+        self._test_funcs = [
+            (name, upload if attr == "test_plugin_upload" else getattr(self, attr))
+            for name, attr in self._TESTS
+        ]
+        # Built once; each upload test gets a retitled copy that shares its file paths
+        self._shared_group = self.simulator.create_mock_group(title="Test", file_count=self._MAX_MOCK_FILES)
 
     def print_header(self, text: str, char: str = "="):
         """Print formatted header."""
@@ -309,13 +358,7 @@ class PluginTestRunner:
         self.print_section(f"Testing {plugin.name} Validation")
 
         # Create test config
-        config = {
-            "thumbnail_size": "180",
-            "content_type": "Safe",
-            "cover_count": "2",
-            "save_links": True,
-            "gallery_id": ""
-        }
+        config = {**self._BASE_CONFIG, "cover_count": "2"}
 
         errors = plugin.validate_configuration(config)
 
@@ -335,49 +378,40 @@ class PluginTestRunner:
         self.print_section(f"Testing {plugin.name} Mock Upload")
 
         # Create mock data
-        group = self.simulator.create_mock_group(
+        group = replace(
+            self._shared_group,
             title=f"Test Gallery - {plugin.name}",
-            file_count=file_count
+            files=self._shared_group.files[:file_count],
         )
 
         print(f"  Group: {group}")
         print(f"  Files: {len(group.files)}")
 
         # Create test config
-        config = {
-            "thumbnail_size": "180",
-            "content_type": "Safe",
-            "cover_count": "1",
-            "save_links": True,
-            "gallery_id": "",
-            "auto_gallery": True
-        }
+        config = {**self._BASE_CONFIG, "cover_count": "1", "auto_gallery": True}
 
         # Validate config
         plugin.validate_configuration(config)
 
         # Simulate uploads
-        results = []
-        for i, file_path in enumerate(group.files[:file_count], 1):
-            file = MockFile(path=file_path, name=os.path.basename(file_path))
-
-            if not self.verbose:
-                print(f"  Uploading {i}/{file_count}: {file.name}...", end='')
-
-            result = self.simulator.simulate_upload(plugin, file, group, config)
-            results.append(result)
+        files = [MockFile.from_path(p) for p in group.files[:file_count]]
 
-            if not self.verbose:
-                print(f" ✓")
+        results = [self.simulator.simulate_upload(plugin, file, group, config) for file in files]
+        if not self.verbose:
+            print("\n".join(
+                f"  Uploading {i}/{file_count}: {file.name}... ✓" for i, file in enumerate(files, 1)
+            ))
 
         # Summary
-        success_count = sum(1 for r in results if r.success)
+        success_count = sum(map(operator.attrgetter("success"), results))
         print(f"\n  ✓ Upload complete: {success_count}/{len(results)} successful")
 
         return success_count == len(results)
 
     def test_helper_usage(self) -> bool:
         """Test helper function integration."""
+        from modules.plugins import helpers
+
         self.print_section("Testing Helper Function Integration")
 
         # Test validate_cover_count
@@ -387,8 +421,7 @@ class PluginTestRunner:
         print(f"  ✓ validate_cover_count: cover_limit = {config.get('cover_limit')}")
 
         # Test is_cover_image
-        group = Mock()
-        group.files = ["/a.jpg", "/b.jpg", "/c.jpg"]
+        group = _HELPER_TEST_GROUP
         config = {"cover_limit": 2}
 
         is_cover_a = helpers.is_cover_image("/a.jpg", group, config)
@@ -427,19 +460,11 @@ class PluginTestRunner:
 
             self.print_header(f"Testing: {plugin.name}", "═")
 
-            # Run tests
-            tests = [
-                ("Metadata", lambda: self.test_plugin_metadata(plugin)),
-                ("Schema", lambda: self.test_plugin_schema(plugin)),
-                ("Validation", lambda: self.test_plugin_validation(plugin)),
-                ("Mock Upload", lambda: self.test_plugin_upload(plugin, file_count=3 if self.verbose else 2)),
-            ]
-
             plugin_results = {}
-            for test_name, test_func in tests:
+            for test_name, test_func in self._test_funcs:
                 total_tests += 1
                 try:
-                    result = test_func()
+                    result = test_func(plugin)
                     plugin_results[test_name] = result
                     if result:
                         passed_tests += 1
@@ -463,7 +488,7 @@ class PluginTestRunner:
         plugin_map = {p.id: p for p in plugins}
         for plugin_id, results in self.results.items():
             plugin = plugin_map[plugin_id]
-            passed = sum(1 for r in results.values() if r)
+            passed = sum(map(bool, results.values()))
             total = len(results)
             status = "✓" if passed == total else "⚠"
             print(f"    {status} {plugin.name:20} {passed}/{total} tests passed")
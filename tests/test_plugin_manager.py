@@ -1,16 +1,19 @@
 """Comprehensive tests for modules/plugin_manager.py - Plugin discovery and management"""
 
 import pytest
-import sys
-import os
+import importlib
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+plugin_manager = pytest.importorskip("modules.plugin_manager")
+PluginManager = plugin_manager.PluginManager
 
-from modules.plugin_manager import PluginManager
+
+@pytest.fixture(scope="session")
+def pm():
+    """One PluginManager shared by tests that only read from it"""
+    return PluginManager()
 
 
 @pytest.mark.unit
@@ -19,7 +22,6 @@ class TestPluginManagerImports:
 
     def test_module_import(self):
         """Test that plugin_manager module imports without error"""
-        from modules import plugin_manager
         assert plugin_manager is not None
 
     def test_plugin_manager_class_exists(self):
@@ -41,14 +43,9 @@ class TestPluginManagerInstantiation:
                 # May fail if plugins directory structure is required
                 pytest.skip(f"Requires plugin directory structure: {e}")
 
-    def test_can_instantiate_default(self):
+    def test_can_instantiate_default(self, pm):
         """Test instantiation with default plugins directory"""
-        try:
-            pm = PluginManager()
-            assert pm is not None
-        except Exception:
-            # May fail in test environment without proper directory structure
-            pytest.skip("Requires proper directory structure")
+        assert pm is not None
 
 
 @pytest.mark.unit
@@ -313,6 +310,31 @@ class TestPluginErrors:
         assert not has_required
 
 
+@pytest.mark.unit
+class TestPluginDiscoveryCache:
+    """Test that plugin discovery is shared between PluginManager instances"""
+
+    def test_second_manager_skips_import_scan(self, pm):
+        """Test that a second manager reuses discovery but gets its own instances"""
+        first = pm
+        with patch("modules.plugin_manager.importlib.import_module") as mock_import:
+            second = PluginManager()
+        mock_import.assert_not_called()
+        assert second.get_service_names() == first.get_service_names()
+        assert all(
+            second.get_plugin(pid) is not first.get_plugin(pid) for pid in first.get_service_names()
+        )
+
+    def test_force_rescans(self):
+        """Test that load_plugins(force=True) runs discovery again"""
+        pm = PluginManager()
+        with patch(
+            "modules.plugin_manager.importlib.import_module", wraps=importlib.import_module
+        ) as mock_import:
+            pm.load_plugins(force=True)
+        assert mock_import.called
+
+
 @pytest.mark.integration
 class TestPluginManagerIntegration:
     """Integration tests for plugin manager"""
@@ -357,6 +357,12 @@ class TestPluginBaseClass(unittest.TestCase):
         metadata = plugin.metadata
         self.assertIsInstance(metadata, dict)
 
+    def test_metadata_and_schema_built_once(self):
+        """Test that metadata/settings_schema are cached per plugin instance."""
+        plugin = self._create_test_plugin()
+        self.assertIs(plugin.metadata, plugin.metadata)
+        self.assertIs(plugin.settings_schema, plugin.settings_schema)
+
     def test_base_plugin_validate_configuration(self):
         """Test that base plugin validation returns empty errors."""
         plugin = self._create_test_plugin()
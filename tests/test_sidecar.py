@@ -9,10 +9,7 @@ import time
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from modules.sidecar import SidecarBridge
+from modules.sidecar import EventInbox, SidecarBridge
 
 
 class TestSidecarImports:
@@ -126,6 +123,32 @@ class TestSidecarEventListeners:
         assert q1 is not q3
 
 
+@pytest.mark.unit
+class TestEventInbox:
+    """Test the batched listener used by UploadManager"""
+
+    def test_drain_returns_all_pending_in_order(self):
+        """Test that one drain takes every queued event, oldest first"""
+        inbox = EventInbox()
+        for i in range(5):
+            inbox.put({"n": i})
+        assert [e["n"] for e in inbox.drain(timeout=0)] == [0, 1, 2, 3, 4]
+        assert inbox.drain(timeout=0) == []
+
+    def test_drain_times_out_when_empty(self):
+        """Test that drain returns an empty list after the timeout"""
+        inbox = EventInbox()
+        start = time.monotonic()
+        assert inbox.drain(timeout=0.05) == []
+        assert time.monotonic() - start >= 0.04
+
+    def test_put_wakes_waiting_consumer(self):
+        """Test that a put from another thread wakes a blocked drain"""
+        inbox = EventInbox()
+        threading.Timer(0.05, inbox.put, args=({"type": "status"},)).start()
+        assert inbox.drain(timeout=2) == [{"type": "status"}]
+
+
 @pytest.mark.unit
 class TestSidecarLocking:
     """Test thread-safety of sidecar operations"""
@@ -1,15 +1,10 @@
 """Comprehensive tests for modules/template_manager.py - Template management and substitution"""
 
 import pytest
-import os
-import sys
 import tempfile
 import json
 from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from modules.template_manager import TemplateManager
 
 
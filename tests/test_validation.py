@@ -2,14 +2,10 @@
 
 import pytest
 import os
-import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from modules.validation import (
     validate_file_path,
     validate_directory_path,
@@ -85,6 +81,26 @@ class TestValidateFilePath:
             result = validate_file_path(str(hidden_file))
             assert result is None
 
+    @pytest.mark.parametrize("target", ["payload.exe", ".hidden.jpg"])
+    def test_symlink_target_checked(self, tmp_path, target):
+        """Test that extension/hidden checks apply to a symlink's target, not its name"""
+        (tmp_path / target).touch()
+        link = tmp_path / "x.jpg"
+        try:
+            link.symlink_to(tmp_path / target)
+        except (OSError, NotImplementedError):
+            pytest.skip("symlinks not supported here")
+        assert validate_file_path(str(link)) is None
+
+    def test_relative_parent_path_accepted(self, tmp_path, monkeypatch):
+        """Test that a legitimate '../dir/file.jpg' path resolves and validates"""
+        (tmp_path / "pics").mkdir()
+        (tmp_path / "work").mkdir()
+        image = tmp_path / "pics" / "a.jpg"
+        image.touch()
+        monkeypatch.chdir(tmp_path / "work")
+        assert validate_file_path(os.path.join("..", "pics", "a.jpg")) == os.path.realpath(image)
+
 
 @pytest.mark.unit
 class TestValidateDirectoryPath:
@@ -221,12 +237,7 @@ class TestValidateServiceName:
         """Test validation with plugin manager"""
         # Mock plugin manager
         mock_pm = Mock()
-        mock_plugin1 = Mock()
-        mock_plugin1.service_id = "custom.service"
-        mock_plugin2 = Mock()
-        mock_plugin2.service_id = "another.service"
-
-        mock_pm.get_all_plugins.return_value = [mock_plugin1, mock_plugin2]
+        mock_pm.service_id_set = frozenset({"custom.service", "another.service"})
 
         # Should accept services from plugin manager
         result = validate_service_name("custom.service", plugin_manager=mock_pm)